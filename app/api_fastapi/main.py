@@ -6,6 +6,7 @@ from typing import AsyncGenerator
 from aiogram import Bot
 from fastapi import FastAPI
 
+from app.api_fastapi.dependencies import get_dispatcher
 from app.api_fastapi.routers import telegram_webhook_router, n8n_webhook_router
 from app.bot_telegram import (
     init_database,
@@ -86,6 +87,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             await bot_manager.bot.session.close()
             logger.info('Webhook deleted and bot session closed successfully.')
 
+        # Polling mode emits shutdown itself, in webhook mode the routers are notified here
+        await get_dispatcher().emit_shutdown()
+        logger.info('Dispatcher shutdown handlers completed.')
+
         await close_database()
         logger.info('Database closed successfully.')
 
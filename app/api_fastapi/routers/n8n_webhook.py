@@ -178,6 +178,8 @@ async def new_form_webhook(
         Acknowledgment of successful processing of the new form.
     """
     try:
+        SurveyService.clear_active_surveys_cache()
+
         bound_chat: Chat | None = await chat_service.get_bound_chat()
         bound_thread_id: int | None = bound_chat.thread_id if bound_chat else None
 
@@ -25,7 +25,8 @@ class BotManager:
     Methods:
         create_bot(): Creates and returns an instance of the bot.
         create_dispatcher(): Creates and returns an instance of the dispatcher.
-        ensure_creator_exists(): Creates the creator user if not already present in the database.
+        ensure_creator_exists(): Creates the creator user if not already present in the database
+            and loads the role cache.
         start_polling(): Starts the bot in polling mode.
     
     Properties:
@@ -86,6 +87,7 @@ class BotManager:
     async def ensure_creator_exists(self) -> None:
         """
         Creates the creator user if not already present in the database.
+        Loads the in-memory role cache used by authorization checks.
 
         Returns:
             None
@@ -101,6 +103,9 @@ class BotManager:
         else:
             logger.info('Creator user already exists, skipping creation.')
 
+        await self.user_service.refresh_role_cache()
+        logger.info('Role cache loaded.')
+
     @property
     def bot(self) -> Bot | None:
         """
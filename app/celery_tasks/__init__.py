@@ -1,5 +1,6 @@
 from .telegram_tasks import (
     send_telegram_message,
+    send_telegram_message_batch,
     send_bulk_messages,
     send_and_pin_telegram_message,
     ban_user_from_chat
@@ -7,6 +8,7 @@ from .telegram_tasks import (
 
 __all__ = [
     'send_telegram_message',
+    'send_telegram_message_batch',
     'send_bulk_messages',
     'send_and_pin_telegram_message',
     'ban_user_from_chat'
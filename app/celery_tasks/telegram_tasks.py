@@ -8,7 +8,7 @@ from typing import AsyncGenerator
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramRetryAfter, TelegramAPIError
-from aiogram.types import Message, InlineKeyboardMarkup
+from aiogram.types import Message, InlineKeyboardMarkup, MessageEntity
 from aiohttp import ClientConnectionError, ClientError
 from celery.result import AsyncResult
 
@@ -77,7 +77,8 @@ def send_telegram_message(
         message_id: int | None = None,
         message_thread_id: int | None = None,
         reply_markup: dict | None = None,
-        disable_web_page_preview: bool = False
+        disable_web_page_preview: bool = False,
+        entities: list[dict] | None = None
 ) -> TaskResponse | None:
     """
     Send a message to Telegram via Celery.
@@ -91,6 +92,7 @@ def send_telegram_message(
         message_thread_id (int | None): Thread ID for topics
         reply_markup (dict | None): Reply markup as a dictionary
         disable_web_page_preview (bool): Disable web page preview
+        entities (list[dict] | None): Message entities as dictionaries, used instead of parse_mode
 
     Raises:
         self.retry: Retries the task in case of rate limiting or network errors.
@@ -105,11 +107,15 @@ def send_telegram_message(
         if reply_markup:
             reply_markup_obj = InlineKeyboardMarkup.model_validate(reply_markup)
 
+        entity_objs: list[MessageEntity] | None = \
+            [MessageEntity.model_validate(entity) for entity in entities] if entities else None
+
         async with _bot_context() as bot:
             send_result: Message = await bot.send_message(
                 chat_id=chat_id,
                 text=text,
                 parse_mode=parse_mode,
+                entities=entity_objs,
                 reply_to_message_id=message_id,
                 message_thread_id=message_thread_id,
                 reply_markup=reply_markup_obj,
@@ -150,6 +156,76 @@ def send_telegram_message(
         return TaskResponse(status='error', message=str(e))
 
 
+@celery_app.task(bind=True, ignore_result=True)
+def send_telegram_message_batch(self, messages: list[dict]) -> list[TaskResponse]:
+    """
+    Send a batch of messages within a single bot session via Celery.
+    Messages that hit a rate limit or a network error are re-queued one by one
+    through send_telegram_message, which retries them.
+
+    Args:
+        self: The task instance.
+        messages: List of message data dictionaries, each containing:
+            - chat_id: Chat ID
+            - text: Message text
+            - parse_mode: Parse mode (HTML, Markdown) [optional]
+            - disable_web_page_preview: Disable web page preview [optional]
+            - message_id: If provided, reply to this message ID [optional]
+            - message_thread_id: Thread ID for topics [optional]
+            - entities: Message entities as dictionaries, used instead of parse_mode [optional]
+
+    Returns:
+        A list of TaskResponse objects with sending status for each message.
+    """
+
+    async def _send_batch() -> list[TaskResponse]:
+        results: list[TaskResponse] = []
+
+        async with _bot_context() as bot:
+            for message_data in messages:
+                chat_id: int = message_data['chat_id']
+                entities: list[dict] | None = message_data.get('entities')
+                try:
+                    send_result: Message = await bot.send_message(
+                        chat_id=chat_id,
+                        text=message_data['text'],
+                        parse_mode=message_data.get('parse_mode', 'HTML'),
+                        entities=[MessageEntity.model_validate(entity) for entity in entities] if entities else None,
+                        reply_to_message_id=message_data.get('message_id'),
+                        message_thread_id=message_data.get('message_thread_id'),
+                        disable_web_page_preview=message_data.get('disable_web_page_preview', False)
+                    )
+                    results.append(TaskResponse(status='success', message_id=send_result.message_id))
+
+                except TelegramRetryAfter as e:
+                    logger.warning(
+                        'Rate limit hit for chat %s in batch. Re-queued after %d seconds', chat_id, e.retry_after
+                    )
+                    send_telegram_message.apply_async(kwargs=message_data, countdown=e.retry_after)
+                    results.append(TaskResponse(status='requeued', message=str(e)))
+
+                except (ClientConnectionError, TimeoutError, ClientError) as e:
+                    logger.warning('Network error for chat %s in batch: %s. Re-queued', chat_id, str(e))
+                    send_telegram_message.delay(**message_data)
+                    results.append(TaskResponse(status='requeued', message=str(e)))
+
+                except TelegramAPIError as e:
+                    logger.error('Telegram API error for chat %s in batch: %s', chat_id, str(e))
+                    results.append(TaskResponse(status='error', message=str(e)))
+
+        return results
+
+    try:
+        batch_results: list[TaskResponse] = asyncio.run(_send_batch())
+
+        logger.info('Message batch processed, count: %s', len(batch_results))
+        return batch_results
+
+    except Exception as e:
+        logger.error('Unexpected error sending message batch: %s\n%s', str(e), traceback.format_exc())
+        return [TaskResponse(status='error', message=str(e))]
+
+
 @celery_app.task(bind=True, max_retries=5, ignore_result=True)
 def send_and_pin_telegram_message(
         self,
@@ -252,7 +328,7 @@ def ban_user_from_chat(self, chat_id: int, user_id: int) -> TaskResponse | None:
         async def _ban_user():
             async with _bot_context() as bot:
                 await bot.ban_chat_member(chat_id=chat_id, user_id=user_id)
-                logger.info(f'User {user_id} banned from chat {chat_id}')
+                logger.info('User %s banned from chat %s', user_id, chat_id)
 
         asyncio.run(_ban_user())
         return TaskResponse(status='success', detail=f'User {user_id} banned from chat {chat_id}')
@@ -273,7 +349,7 @@ def ban_user_from_chat(self, chat_id: int, user_id: int) -> TaskResponse | None:
                     'cannot connect', 'connection', 'timeout', 'network'
                 ]
         ):
-            logger.warning(f'Telegram API error for chat {chat_id}: {e}')
+            logger.warning('Telegram API error for chat %s: %s', chat_id, str(e))
             return _handle_network_error(self, chat_id, ClientConnectionError(error_message))
 
     except Exception as e:
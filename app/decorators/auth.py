@@ -5,189 +5,146 @@ from aiogram.enums import ChatType
 from aiogram.types import Message
 
 from app.models import User, Chat
-from app.services import UserService, ChatService, MessageQueueService
+from app.services import UserService, ChatService
 
 T = TypeVar('T')
 
+NOT_CREATOR_TEXT: str = (
+    '❌ У вас нет прав для выполнения этой команды.\n'
+    'Только создатель бота может выполнять эту операцию.'
+)
+NOT_ADMIN_TEXT: str = (
+    '❌ У вас нет прав для выполнения этой команды.\n'
+    'Только администраторы и создатель бота могут выполнять эту операцию.'
+)
+PRIVATE_CHAT_TEXT: str = '❌ Данную команду нельзя использовать в приватном чате.'
+CHAT_NOT_BOUND_TEXT: str = (
+    '❌ Данную команду можно использовать только '
+    'в привязанном к боту чате.'
+)
+NOT_REGISTERED_TEXT: str = (
+    '❌ Вы не зарегистрированы в системе.\n'
+    'Пожалуйста, используйте команду '
+    '/reg вместе с вашим позывным для регистрации.'
+)
+
 
 class AuthDecorators:
     """
     Class containing decorators for authentication checks.
-    
-    Attributes:
-        message_queue_service: Instance of MessageQueueService for sending messages.
+    Error messages are sent with the message_queue_service of the decorated handler class.
 
     Methods:
-        required_creator: Decorator to check if the user is the bot creator.
-        required_admin: Decorator to check if the user is an administrator or the bot creator.
-        required_user_registration: Decorator to check if the user is registered in the system.
-        required_chat_bind: Decorator to check if the command is executed in a bound chat.
-        required_not_private_chat: Decorator to check if the command is executed in a non-private chat.
+        require: Decorator factory that runs all requested checks in a single wrapper.
     """
 
-    def __init__(self):
-        self.message_queue_service: MessageQueueService = MessageQueueService()
-
-    @staticmethod
-    def required_creator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T | None]]:
-        """
-        Decorator to check if the user is the bot creator.
-        If the user is not the creator, an error message is sent.
-
-        Args:
-            func: Function to be decorated.
-
-        Returns:
-            Wrapped asynchronous function with the same arguments as the original function.
-        """
-
-        @wraps(func)
-        async def wrapper(self, message: Message, *args, **kwargs) -> T | None:
-            user_service: UserService = UserService()
-            user: User = await user_service.get_user_by_telegram_id(message.from_user.id)
-
-            if not user or not user.is_creator:
-                await self.message_queue_service.send_message(
-                    chat_id=message.chat.id,
-                    text='❌ У вас нет прав для выполнения этой команды.\n'
-                         'Только создатель бота может выполнять эту операцию.',
-                    parse_mode='Markdown',
-                    message_id=message.message_id
-                )
-                return None
-
-            return await func(self, message, *args, **kwargs)
-
-        return wrapper
-
     @staticmethod
-    def required_admin(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    async def _check_requirements(
+            message: Message,
+            creator: bool,
+            admin: bool,
+            non_private: bool,
+            chat_bound: bool,
+            registered: bool
+    ) -> tuple[str | None, User | None]:
         """
-        Decorator to check if the user is an administrator or the bot creator.
-        If the user is not an admin or creator, an error message is sent.
+        Evaluates the requested checks in order and stops on the first failed one.
+        Database queries are made only for the checks that need them.
+        The user loaded by the registered check is returned,
+        so the handler does not have to query it again.
 
         Args:
-            func: Function to be decorated.
+            message (Message): Incoming message from the user.
+            creator (bool): The user must be the bot creator.
+            admin (bool): The user must be an administrator or the bot creator.
+            non_private (bool): The command must not be executed in a private chat.
+            chat_bound (bool): The command must be executed in a bound chat.
+            registered (bool): The user must be registered in the system.
 
         Returns:
-            Wrapped asynchronous function with the same arguments as the original function.
+            Error text for the first failed check or None if all checks passed,
+            and the registered user if the registered check was requested.
         """
+        if creator and not UserService.has_creator_role(message.from_user.id):
+            return NOT_CREATOR_TEXT, None
 
-        @wraps(func)
-        async def wrapper(self, message: Message, *args, **kwargs) -> T:
-            user_service: UserService = UserService()
-            user: User = await user_service.get_user_by_telegram_id(message.from_user.id)
-
-            if not user or not user.is_admin:
-                await self.message_queue_service.send_message(
-                    chat_id=message.chat.id,
-                    text='❌ У вас нет прав для выполнения этой команды.\n'
-                         'Только администраторы и создатель бота могут выполнять эту операцию.',
-                    parse_mode='Markdown',
-                    message_id=message.message_id
-                )
-                return None
+        if admin and not UserService.has_admin_role(message.from_user.id):
+            return NOT_ADMIN_TEXT, None
 
-            return await func(self, message, *args, **kwargs)
+        if non_private and message.chat.type == ChatType.PRIVATE:
+            return PRIVATE_CHAT_TEXT, None
 
-        return wrapper
+        if chat_bound:
+            chat: Chat | None = await ChatService.get_cached_chat_by_telegram_id(message.chat.id)
+            if not chat:
+                return CHAT_NOT_BOUND_TEXT, None
 
-    @staticmethod
-    def required_user_registration(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T | None]]:
-        """
-        Decorator to check if the user is registered in the system.
-        If the user is not registered, an error message is sent.
-
-        Args:
-            func: Function to be decorated.
-
-        Returns:
-            Wrapped asynchronous function with the same arguments as the original function.
-        """
-
-        @wraps(func)
-        async def wrapper(self, message: Message, *args, **kwargs) -> T:
-            user_service: UserService = UserService()
-            user: User = await user_service.get_user_by_telegram_id(message.from_user.id)
+        user: User | None = None
 
+        if registered:
+            user = await UserService.get_user_by_telegram_id(message.from_user.id)
             if not user:
-                await self.message_queue_service.send_message(
-                    chat_id=message.chat.id,
-                    text='❌ Вы не зарегистрированы в системе.\n'
-                         'Пожалуйста, используйте команду '
-                         '/reg вместе с вашим позывным для регистрации.',
-                    parse_mode='Markdown',
-                    message_id=message.message_id
-                )
-                return None
-
-            return await func(self, message, *args, **kwargs)
+                return NOT_REGISTERED_TEXT, None
 
-        return wrapper
+        return None, user
 
     @staticmethod
-    def required_chat_bind(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T | None]]:
+    def require(
+            *,
+            creator: bool = False,
+            admin: bool = False,
+            non_private: bool = False,
+            chat_bound: bool = False,
+            registered: bool = False,
+            pass_user: bool = False
+    ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T | None]]]:
         """
-        Decorator to check if the command is executed in a chat that is bound to the bot.
-        If the chat is not bound, an error message is sent.
+        Decorator factory to check access to a command with a single wrapper.
+        Checks are evaluated in the following order: creator, admin, non_private,
+        chat_bound, registered. On the first failed check an error message is sent
+        and the decorated function is not called.
 
         Args:
-            func: Function to be decorated.
+            creator: The user must be the bot creator.
+            admin: The user must be an administrator or the bot creator.
+            non_private: The command must not be executed in a private chat.
+            chat_bound: The command must be executed in a chat that is bound to the bot.
+            registered: The user must be registered in the system.
+            pass_user: Pass the user loaded by the registered check to the decorated
+                function as the `user` keyword argument. Implies registered.
 
         Returns:
-            Wrapped asynchronous function with the same arguments as the original function.
+            Decorator that wraps an asynchronous function with the same arguments as the original function.
         """
 
-        @wraps(func)
-        async def wrapper(self, message: Message, *args, **kwargs) -> T:
-            chat_service: ChatService = ChatService()
-            chat_exists: Chat | None = await chat_service.get_chat_by_telegram_id(message.chat.id)
-            if not chat_exists:
-                await self.message_queue_service.send_message(
-                    chat_id=message.chat.id,
-                    text='❌ Данную команду можно использовать только '
-                         'в привязанном к боту чате.',
-                    parse_mode='Markdown',
-                    message_id=message.message_id
+        def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T | None]]:
+            @wraps(func)
+            async def wrapper(self, message: Message, *args, **kwargs) -> T | None:
+                error_text: str | None
+                user: User | None
+                error_text, user = await AuthDecorators._check_requirements(
+                    message=message,
+                    creator=creator,
+                    admin=admin,
+                    non_private=non_private,
+                    chat_bound=chat_bound,
+                    registered=registered or pass_user
                 )
-                return None
 
-            return await func(self, message, *args, **kwargs)
+                if error_text:
+                    await self.message_queue_service.send_message(
+                        chat_id=message.chat.id,
+                        text=error_text,
+                        parse_mode='Markdown',
+                        message_id=message.message_id
+                    )
+                    return None
 
-        return wrapper
+                if pass_user:
+                    kwargs['user'] = user
 
-    @staticmethod
-    def required_not_private_chat(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T | None]]:
-        """
-        Decorator to check if the command is executed in a chat that is not private.
-
-        Args:
-            func: Function to be decorated.
-
-        Returns:
-            Wrapped asynchronous function with the same arguments as the original function.
-        """
-
-        @wraps(func)
-        async def wrapper(self, message: Message, *args, **kwargs) -> T | None:
-            if not hasattr(message, "chat") or message.chat is None:
-                await self.message_queue_service.send_message(
-                    chat_id=message.chat.id,
-                    text='❌ Не удалось определить тип чата для этой команды.',
-                    parse_mode='Markdown',
-                    message_id=message.message_id
-                )
-                return None
-
-            if message.chat.type == ChatType.PRIVATE:
-                await self.message_queue_service.send_message(
-                    chat_id=message.chat.id,
-                    text='❌ Данную команду нельзя использовать в приватном чате.',
-                    parse_mode='Markdown',
-                    message_id=message.message_id
-                )
-                return None
+                return await func(self, message, *args, **kwargs)
 
-            return await func(self, message, *args, **kwargs)
+            return wrapper
 
-        return wrapper
+        return decorator
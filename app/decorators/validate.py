@@ -1,36 +1,98 @@
-from functools import wraps
 from datetime import datetime
+from functools import wraps
 from typing import Awaitable, Callable, TypeVar, Any
 
 from aiogram.types import Message
 
-from app.services import MessageQueueService
 from app.utils import ValidationResult
 from app.utils import (
     validate_callsign_format, 
     validate_datetime_format,
-    send_callsign_validation_error
+    send_callsign_validation_error,
+    markdown_code_entities,
+    CALLSIGN_REQUIREMENTS_TEXT,
+    CALLSIGN_TOO_LONG_MESSAGE
 )
 
 T = TypeVar('T')
 
+# `/reg@bot_username callsign` is at most 5 + 32 + 1 + 20 = 58 characters,
+# anything longer is answered with the callsign length error without splitting the text.
+MAX_REG_COMMAND_LENGTH: int = 64
+REG_TOO_LONG_RESULT: ValidationResult = ValidationResult(is_valid=False, error_message=CALLSIGN_TOO_LONG_MESSAGE)
+
+# Replies are converted from Markdown into plain text and code entities once at import,
+# so they are sent without parse_mode and Telegram does not have to parse them.
+REG_NO_TEXT_TEXT, REG_NO_TEXT_ENTITIES = markdown_code_entities(
+    '❌ Неверный формат команды.\n'
+    'Отправь команду `/reg позывной`\n'
+    'Команда не должна содержать ничего, кроме текста!'
+)
+REG_NO_CALLSIGN_TEXT, REG_NO_CALLSIGN_ENTITIES = markdown_code_entities(
+    '❌ Нужно обязательно написать свой позывной '
+    '(одно слово) '
+    'в текстовом поле после команды.\n\n'
+    'Используйте: `/reg позывной`\n\n'
+    f'{CALLSIGN_REQUIREMENTS_TEXT}'
+)
+UPDATE_NO_TEXT_TEXT, UPDATE_NO_TEXT_ENTITIES = markdown_code_entities(
+    '❌ Неверный формат команды.\n'
+    'Отправь команду `/update позывной`\n'
+    'Команда не должна содержать ничего, кроме текста!'
+)
+
+# The last ' + ' after the command separates the survey name from the end date
+SURVEY_SEPARATOR: str = ' + '
+SURVEY_TITLE_MAX_LENGTH: int = 100
+
+SURVEY_USAGE_TEXT: str = (
+    'Отправь команду `/create_survey '
+    'Название_опроса + Время_окончания_опроса`\n\n'
+    'Пример правильной команды:\n'
+    '`/create_survey Месим говно 24 часа на броне + 2025-01-01 23:59`\n\n'
+    'Время окончания опроса должно быть в формате\n`YYYY-MM-DD HH:MM`\n'
+    'и быть в будущем.'
+)
+SURVEY_NO_TEXT_TEXT, SURVEY_NO_TEXT_ENTITIES = markdown_code_entities(
+    '❌ Неверный формат команды.\n'
+    'Отправь команду `/create_survey '
+    'Название_опроса + Время_окончания_опроса `\n'
+    'Команда не должна содержать ничего, кроме текста!'
+)
+SURVEY_NO_PARAMS_TEXT, SURVEY_NO_PARAMS_ENTITIES = markdown_code_entities(
+    '❌ Команда не может быть выполнена '
+    'так как не были указаны параметры создания опроса.\n\n'
+    f'{SURVEY_USAGE_TEXT}'
+)
+SURVEY_BAD_FORMAT_TEXT, SURVEY_BAD_FORMAT_ENTITIES = markdown_code_entities(
+    f'❌ Неверный формат команды.\n{SURVEY_USAGE_TEXT}'
+)
+SURVEY_EMPTY_TITLE_TEXT, SURVEY_EMPTY_TITLE_ENTITIES = markdown_code_entities(
+    f'❌ Название опроса не может быть пустым.\n{SURVEY_USAGE_TEXT}'
+)
+SURVEY_BAD_DATETIME_TEMPLATE: str = (
+    '❌ Неверный формат даты и времени.\n\n'
+    '{error_message}\n\n'
+    'Время окончания опроса должно быть в формате\n`YYYY-MM-DD HH:MM`\n'
+    'и быть в будущем.'
+)
+SURVEY_TITLE_TOO_LONG_TEXT, SURVEY_TITLE_TOO_LONG_ENTITIES = markdown_code_entities(
+    '❌ Слишком длинное название опроса.\n\n'
+    'Максимальная длина названия опроса - 100 символов.'
+)
+
 
 class CallsignDecorators:
     """
     Class containing decorators for callsign validation.
     Works with methods of classes, not regular functions.
+    Error messages are sent with the message_queue_service of the decorated handler class.
 
-    Attributes:
-        message_queue_service: Instance of MessageQueueService for sending messages.
-    
     Methods:
         validate_callsign_create: Decorator to validate callsign in the /reg command.
         validate_callsign_update: Decorator to validate callsign in the /update command.
     """
 
-    def __init__(self):
-        self.message_queue_service: MessageQueueService = MessageQueueService()
-
     @staticmethod
     def validate_callsign_create(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T | None]]:
         """
@@ -40,7 +102,9 @@ class CallsignDecorators:
         - Length from 1 to 20 characters
         - No digits, special characters, or spaces
         - Callsign must be unique
-        If the callsign is invalid, sends an error message and does not call the main function
+        Commands longer than MAX_REG_COMMAND_LENGTH get the callsign length error without being split.
+        If the callsign is invalid, sends an error message and does not call the main function.
+        The parsed callsign is passed to the main function as the `callsign` keyword argument.
 
         Args:
             func: Function to be decorated
@@ -51,31 +115,37 @@ class CallsignDecorators:
 
         @wraps(func)
         async def wrapper(self, message: Message, *args: Any, **kwargs: Any) -> T | None:
-            if not message.text:
-                await self.message_queue_service.send_message(
+            text: str | None = message.text
+
+            if text is None:
+                await self.message_queue_service.enqueue_error(
                     chat_id=message.chat.id,
-                    text='❌ Неверный формат команды.\n'
-                         'Отправь команду `/reg позывной`\n'
-                         'Команда не должна содержать ничего, кроме текста!',
-                    parse_mode='Markdown',
+                    text=REG_NO_TEXT_TEXT,
+                    entities=REG_NO_TEXT_ENTITIES,
+                    parse_mode=None,
                     message_id=message.message_id
                 )
                 return None
 
-            command_parts: list[str] = message.text.split()
+            if len(text) > MAX_REG_COMMAND_LENGTH:
+                await send_callsign_validation_error(
+                    message_queue_service=self.message_queue_service,
+                    chat_id=message.chat.id,
+                    validation_result=REG_TOO_LONG_RESULT,
+                    command='/reg',
+                    message_id=message.message_id
+                )
+                return None
+
+            # Only the command and the callsign are needed, a third part means extra words
+            command_parts: list[str] = text.split(maxsplit=2)
+
             if len(command_parts) != 2:
-                await self.message_queue_service.send_message(
+                await self.message_queue_service.enqueue_error(
                     chat_id=message.chat.id,
-                    text='❌ Нужно обязательно написать свой позывной '
-                         '(одно слово) '
-                         'в текстовом поле после команды.\n\n'
-                         'Используйте: `/reg позывной`\n\n'
-                         'Требования к позывному:\n'
-                         '🔤 Только латинские буквы\n'
-                         '📏 Длина от 1 до 20 символов\n'
-                         '🚫 Без цифр, спец символов и пробелов\n'
-                         '🆔 Позывной должен быть уникальным',
-                    parse_mode='Markdown',
+                    text=REG_NO_CALLSIGN_TEXT,
+                    entities=REG_NO_CALLSIGN_ENTITIES,
+                    parse_mode=None,
                     message_id=message.message_id
                 )
                 return None
@@ -93,7 +163,8 @@ class CallsignDecorators:
                 )
                 return None
 
-            return await func(self, message, callsign, *args, **kwargs)
+            kwargs['callsign'] = callsign
+            return await func(self, message, *args, **kwargs)
 
         return wrapper
 
@@ -106,7 +177,9 @@ class CallsignDecorators:
         - Length from 1 to 20 characters
         - No digits, special characters, or spaces
         - Callsign must be unique
-        If the callsign is invalid, sends an error message and does not call the main function
+        If the callsign is invalid, sends an error message and does not call the main function.
+        The parsed callsign (or None if it was not provided) is passed to the main function
+        as the `callsign` keyword argument, so the command text is split only once.
 
         Args:
             func: Function to be decorated
@@ -117,22 +190,30 @@ class CallsignDecorators:
 
         @wraps(func)
         async def wrapper(self, message: Message, *args: Any, **kwargs: Any) -> T | None:
-            if not message.text:
-                await self.message_queue_service.send_message(
+            text: str | None = message.text
+
+            if text is None:
+                await self.message_queue_service.enqueue_error(
                     chat_id=message.chat.id,
-                    text='❌ Неверный формат команды.\n'
-                         'Отправь команду `/update позывной`\n'
-                         'Команда не должна содержать ничего, кроме текста!',
-                    parse_mode='Markdown',
+                    text=UPDATE_NO_TEXT_TEXT,
+                    entities=UPDATE_NO_TEXT_ENTITIES,
+                    parse_mode=None,
                     message_id=message.message_id
                 )
                 return None
 
-            command_parts: list[str] = message.text.split()
+            # A bare `/update` has no whitespace after the slash, so there is nothing to split
+            if text[1:].isalnum():
+                kwargs['callsign'] = None
+                return await func(self, message, *args, **kwargs)
+
+            # Only the command and the callsign are needed, extra words are ignored
+            command_parts: list[str] = text.split(maxsplit=2)
+            callsign: str | None = None
 
             if len(command_parts) >= 2:
 
-                callsign: str = command_parts[1].strip()
+                callsign = command_parts[1].strip()
 
                 validation_result: ValidationResult = await validate_callsign_format(callsign)
 
@@ -146,6 +227,7 @@ class CallsignDecorators:
                     )
                     return None
 
+            kwargs['callsign'] = callsign
             return await func(self, message, *args, **kwargs)
 
         return wrapper
@@ -155,14 +237,9 @@ class SurveyCreationDecorators:
     """
     Class containing decorators for survey creation validation.
     Works with methods of classes, not regular functions.
-
-    Attributes:
-        message_queue_service: Instance of MessageQueueService for sending messages.
+    Error messages are sent with the message_queue_service of the decorated handler class.
     """
 
-    def __init__(self):
-        self.message_queue_service: MessageQueueService = MessageQueueService()
-
     @staticmethod
     def validate_survey_create(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T | None]]:
         """
@@ -171,6 +248,8 @@ class SurveyCreationDecorators:
         - Survey name is not empty and does not exceed 100 characters
         - End date and time are provided in the correct format (YYYY-MM-DD HH:MM)
         - End date and time are in the future
+        The command (with an optional @bot_username) is split off once, then the last
+        SURVEY_SEPARATOR separates the survey name from the end date.
         If the parameters are invalid, sends an error message and does not call the main function
 
         Args:
@@ -182,103 +261,82 @@ class SurveyCreationDecorators:
 
         @wraps(func)
         async def wrapper(self, message: Message, *args: Any, **kwargs: Any) -> T | None:
-            if not message.text:
-                await self.message_queue_service.send_message(
+            text: str | None = message.text
+
+            if text is None:
+                await self.message_queue_service.enqueue_error(
                     chat_id=message.chat.id,
-                    text=(
-                        '❌ Неверный формат команды.\n'
-                        'Отправь команду `/create_survey '
-                        'Название_опроса + Время_окончания_опроса `\n'
-                        'Команда не должна содержать ничего, кроме текста!'),
-                    parse_mode='Markdown',
+                    text=SURVEY_NO_TEXT_TEXT,
+                    entities=SURVEY_NO_TEXT_ENTITIES,
+                    parse_mode=None,
                     message_id=message.message_id
                 )
                 return None
 
-            text_after_command: str = message.text[len('/create_survey '):].strip()
+            command_parts: list[str] = text.split(maxsplit=1)
 
-            if not text_after_command:
-                await self.message_queue_service.send_message(
+            if len(command_parts) < 2:
+                await self.message_queue_service.enqueue_error(
                     chat_id=message.chat.id,
-                    text=(
-                        '❌ Команда не может быть выполнена '
-                        'так как не были указаны параметры создания опроса.\n\n'
-                        'Отправь команду `/create_survey '
-                        'Название_опроса + Время_окончания_опроса`\n\n'
-                        'Пример правильной команды:\n'
-                        '`/create_survey Месим говно 24 часа на броне + 2025-01-01 23:59`\n\n'
-                        'Время окончания опроса должно быть в формате\n`YYYY-MM-DD HH:MM`\n'
-                        'и быть в будущем.'
-                    ),
-                    parse_mode='Markdown',
+                    text=SURVEY_NO_PARAMS_TEXT,
+                    entities=SURVEY_NO_PARAMS_ENTITIES,
+                    parse_mode=None,
                     message_id=message.message_id
                 )
                 return None
 
-            parts: list[str] = text_after_command.rsplit(' + ', 1)
+            survey_name: str
+            separator: str
+            end_datetime_str: str
+            survey_name, separator, end_datetime_str = command_parts[1].rpartition(SURVEY_SEPARATOR)
 
-            if len(parts) != 2:
-                await self.message_queue_service.send_message(
+            if not separator:
+                await self.message_queue_service.enqueue_error(
                     chat_id=message.chat.id,
-                    text=(
-                        '❌ Неверный формат команды.\n'
-                        'Отправь команду `/create_survey '
-                        'Название_опроса + Время_окончания_опроса`\n\n'
-                        'Пример правильной команды:\n'
-                        '`/create_survey Месим говно 24 часа на броне + 2025-01-01 23:59`\n\n'
-                        'Время окончания опроса должно быть в формате\n`YYYY-MM-DD HH:MM`\n'
-                        'и быть в будущем.'
-                    ),
-                    parse_mode='Markdown',
+                    text=SURVEY_BAD_FORMAT_TEXT,
+                    entities=SURVEY_BAD_FORMAT_ENTITIES,
+                    parse_mode=None,
                     message_id=message.message_id
                 )
                 return None
 
-            survey_name: str = parts[0].strip()
-            end_datetime_str: str = parts[1].strip()
+            survey_name = survey_name.strip()
 
             if not survey_name:
-                await self.message_queue_service.send_message(
+                await self.message_queue_service.enqueue_error(
                     chat_id=message.chat.id,
-                    text=(
-                        '❌ Название опроса не может быть пустым.\n'
-                        'Отправь команду `/create_survey '
-                        'Название_опроса + Время_окончания_опроса`\n\n'
-                        'Пример правильной команды:\n'
-                        '`/create_survey Месим говно 24 часа на броне + 2025-01-01 23:59`\n\n'
-                        'Время окончания опроса должно быть в формате\n`YYYY-MM-DD HH:MM`\n'
-                        'и быть в будущем.'),
-                    parse_mode='Markdown',
+                    text=SURVEY_EMPTY_TITLE_TEXT,
+                    entities=SURVEY_EMPTY_TITLE_ENTITIES,
+                    parse_mode=None,
                     message_id=message.message_id
                 )
                 return None
 
-            validation_datetime_result: ValidationResult = await validate_datetime_format(end_datetime_str)
+            validation_datetime_result: ValidationResult = validate_datetime_format(end_datetime_str.strip())
 
             if not validation_datetime_result.is_valid:
-                await self.message_queue_service.send_message(
+                error_text, error_entities = markdown_code_entities(
+                    SURVEY_BAD_DATETIME_TEMPLATE.format(error_message=validation_datetime_result.error_message)
+                )
+                await self.message_queue_service.enqueue_error(
                     chat_id=message.chat.id,
-                    text=(
-                        f'❌ Неверный формат даты и времени.\n\n'
-                        f'{validation_datetime_result.error_message}\n\n'
-                        f'Время окончания опроса должно быть в формате\n`YYYY-MM-DD HH:MM`\n'
-                        f'и быть в будущем.'),
-                    parse_mode='Markdown',
+                    text=error_text,
+                    entities=error_entities,
+                    parse_mode=None,
                     message_id=message.message_id
                 )
                 return None
 
-            if len(survey_name) > 100:
-                await self.message_queue_service.send_message(
+            if len(survey_name) > SURVEY_TITLE_MAX_LENGTH:
+                await self.message_queue_service.enqueue_error(
                     chat_id=message.chat.id,
-                    text=(
-                        '❌ Слишком длинное название опроса.\n\n'
-                        'Максимальная длина названия опроса - 100 символов.'),
-                    parse_mode='Markdown',
+                    text=SURVEY_TITLE_TOO_LONG_TEXT,
+                    entities=SURVEY_TITLE_TOO_LONG_ENTITIES,
+                    parse_mode=None,
                     message_id=message.message_id
                 )
                 return None
-            
+
             end_datetime: datetime = validation_datetime_result.parsed_datetime
 
             return await func(self, message, survey_name, end_datetime, *args, **kwargs)
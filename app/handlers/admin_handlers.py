@@ -1,9 +1,6 @@
-import json
 import logging
 from datetime import datetime
-from types import SimpleNamespace
 
-import aiohttp
 from aiogram import Router, F
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.filters import Command
@@ -20,12 +17,45 @@ from app.services import (
     ChatAlreadyBoundError,
     SurveyService,
     MessageQueueService,
+    N8nQueueService,
     SurveyTemplateService
 )
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+NEED_CALLSIGN_TEMPLATE: str = (
+    '❌ Пожалуйста, укажите позывной пользователя после команды.\n'
+    'Пример: `{command} позывной`'
+)
+USER_NOT_FOUND_TEXT: str = '❌ Пользователь не найден.'
+CHAT_NOT_BOUND_TEXT: str = '❌ Этот чат не привязан к боту.'
+
+
+def _parse_callsign(text: str) -> str | None:
+    """
+    Extracts the lowercased callsign argument from a command text.
+    The whole text after the command is taken, so extra words make the lookup fail
+    instead of silently matching the first word. The command ends at the first space
+    or line break, and the argument is taken with a single slice instead of splitting the text.
+
+    Args:
+        text (str): Text of the command message.
+
+    Returns:
+        Callsign or None if the command has no argument.
+    """
+    separator_index: int = text.find(' ')
+    newline_index: int = text.find('\n', 0, separator_index if separator_index != -1 else len(text))
+
+    if newline_index != -1:
+        separator_index = newline_index
+
+    if separator_index == -1:
+        return None
+
+    return text[separator_index + 1:].strip().lower() or None
+
 
 class AdminHandlers:
     """
@@ -38,11 +68,12 @@ class AdminHandlers:
         survey_service (SurveyService): Service for survey-related operations.
         message_queue_service (MessageQueueService): Service for sending messages.
         survey_template_service (SurveyTemplateService): Service for survey template operations.
-        n8n (SimpleNamespace): Configuration for n8n webhook integration.
+        n8n_queue_service (N8nQueueService): Service for delivering surveys to n8n.
         tz (str): Timezone information from settings.
     
     Methods:
         _register_handlers(): Registers command handlers in the router.
+        _reply(message: Message, text: str): Replies to the message in Markdown.
         reserve_command(message: Message): Handles the /reserve command.
         create_survey_command(message: Message, title: str, ended_at: datetime): Handles the /create_survey command.
         bind_chat_command(message: Message): Handles the /bind_chat command.
@@ -61,11 +92,7 @@ class AdminHandlers:
         self.survey_service: SurveyService = SurveyService()
         self.message_queue_service: MessageQueueService = MessageQueueService()
         self.survey_template_service: SurveyTemplateService = SurveyTemplateService()
-        self.n8n: SimpleNamespace = SimpleNamespace(
-            internal_url=settings.services.n8n_service,
-            header=settings.n8n.n8n_webhook_header,
-            secret=settings.n8n.n8n_webhook_secret
-        )
+        self.n8n_queue_service: N8nQueueService = N8nQueueService()
         self.tz: str = settings.timezone_zoneinfo
         self._register_handlers()
 
@@ -96,7 +123,30 @@ class AdminHandlers:
         # Callback for unbind chat confirmation
         self.router.callback_query(F.data.startswith('unbind_chat:'))(self.unbind_chat_callback)
 
-    @Auth.required_admin
+        self.router.shutdown.register(self.n8n_queue_service.close)
+        self.router.shutdown.register(self.message_queue_service.close)
+
+    async def _reply(self, message: Message, text: str, **kwargs) -> None:
+        """
+        Queues a Markdown reply to the given message.
+
+        Args:
+            message (Message): Message to reply to.
+            text (str): Reply text.
+            **kwargs: Extra arguments for MessageQueueService.send_message.
+
+        Returns:
+            None
+        """
+        await self.message_queue_service.send_message(
+            chat_id=message.chat.id,
+            text=text,
+            parse_mode='Markdown',
+            message_id=message.message_id,
+            **kwargs
+        )
+
+    @Auth.require(admin=True)
     async def reserve_command(self, message: Message) -> None:
         """
         Command handler for /reserve. Toggles the reservation status of a user by their callsign.
@@ -107,50 +157,33 @@ class AdminHandlers:
         Returns:
             None
         """
-        args: list[str] = message.text.split(maxsplit=1)
-
-        if len(args) < 2 or not args[1].strip():
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Пожалуйста, укажите позывной пользователя после команды.\n'
-                     'Пример: `/reserve позывной`',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        callsign: str | None = _parse_callsign(message.text)
+
+        if callsign is None:
+            await self._reply(message, NEED_CALLSIGN_TEMPLATE.format(command='/reserve'))
             return
 
-        callsign: str = args[1].strip()
-        callsign: str = callsign.lower()
+        display_callsign: str = callsign.capitalize()
 
-        user: User | None = \
-            await self.user_service.get_user_by_callsign(callsign=callsign)
+        reserved: bool | None = await self.user_service.toggle_reserved(callsign=callsign)
 
-        if not user:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text=f'❌ Пользователь с позывным `{callsign.capitalize()}` не найден.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        if reserved is None:
+            await self._reply(message, f'❌ Пользователь с позывным `{display_callsign}` не найден.')
             return
 
-        user.reserved = not user.reserved
-        await user.save()
-        await self.message_queue_service.send_message(
-            chat_id=message.chat.id,
-            text=f'✅ Статус брони от опросов пользователя `{callsign.capitalize()}` изменён на: '
-                 f'{"Есть" if user.reserved else "Нет"}.',
-            parse_mode='Markdown',
-            message_id=message.message_id
+        await self._reply(
+            message,
+            f'✅ Статус брони от опросов пользователя `{display_callsign}` изменён на: '
+            f'{"Есть" if reserved else "Нет"}.'
         )
 
-    @Auth.required_admin
-    @Auth.required_chat_bind
+    @Auth.require(admin=True, chat_bound=True)
     @CreateSurvey.validate_survey_create
     async def create_survey_command(self, message: Message, title: str, ended_at: datetime) -> None:
         """
         Command handler for /create_survey.
-        Creates a new survey using a default template and sends it to n8n.
+        Creates a new survey using a default template and queues it for delivery to n8n.
+        The result of the delivery is sent to the chat by N8nQueueService.
         
         Args:
             message (Message): Incoming message from the user.
@@ -161,91 +194,36 @@ class AdminHandlers:
             None
         """
         survey_template_obj: SurveyTemplate | None = \
-            await self.survey_template_service.get_survey_template_by_name('default')
+            await self.survey_template_service.get_cached_survey_template_by_name('default')
 
         if not survey_template_obj:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Шаблон опроса не найден в базе данных.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+            await self._reply(message, '❌ Шаблон опроса не найден в базе данных.')
             return
 
-        survey_json: str = json.dumps(survey_template_obj.json_content)
+        placeholders: dict[str, str] = {
+            '{{title}}': title,
+            # Naive isoformat gives the same 'YYYY-MM-DD HH:MM:SS' as strftime without the offset
+            '{{ended_at}}': ended_at.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
+        }
+        survey_content, found_placeholders = self.survey_template_service.render_survey_template(
+            survey_template_obj.json_content,
+            placeholders
+        )
 
-        if '{{title}}' not in survey_json or '{{ended_at}}' not in survey_json:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Шаблон опроса не содержит необходимых плейсхолдеров {{title}} или {{ended_at}}.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        if len(found_placeholders) != len(placeholders):
+            await self._reply(message, '❌ Шаблон опроса не содержит необходимых плейсхолдеров {{title}} или {{ended_at}}.')
             return
 
-        survey_json: str = survey_json.replace('{{title}}', title)
-        survey_json: str = survey_json.replace('{{ended_at}}', ended_at.strftime('%Y-%m-%d %H:%M:%S'))
-
-        survey_data: SurveyData = SurveyData(**json.loads(survey_json))
-
-        headers: dict[str, str] = {
-            'Content-Type': 'application/json',
-            self.n8n.header: self.n8n.secret
-        }
+        survey_data: SurveyData = SurveyData(**survey_content)
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                        f'{self.n8n.internal_url}/webhook/create-google-form',
-                        json=survey_data.model_dump(),
-                        headers=headers,
-                ) as response:
-                    if response.status == 200:
-                        await self.message_queue_service.send_message(
-                            chat_id=message.chat.id,
-                            text='✅ Опрос успешно отправлен в n8n для создания!',
-                            parse_mode='Markdown',
-                            message_id=message.message_id
-                        )
-
-                    else:
-                        error_text = await response.text()
-                        logger.error(
-                            'Failed to create survey via n8n. Status: %s, Response: %s',
-                            response.status, error_text
-                        )
-                        await self.message_queue_service.send_message(
-                            chat_id=message.chat.id,
-                            text=(
-                                f'❌ Не удалось отправить опрос на создание. '
-                                f'Попробуйте еще раз позже.'
-                            ),
-                            parse_mode='Markdown',
-                            message_id=message.message_id
-                        )
-
-            except aiohttp.ClientError as e:
-                logger.error('Error connecting to n8n: %s', str(e))
-                await self.message_queue_service.send_message(
-                    chat_id=message.chat.id,
-                    text=f'❌ Ошибка при подключении к n8n. Попробуйте еще раз.',
-                    parse_mode='Markdown',
-                    message_id=message.message_id
-                )
-                return
-
-            except Exception as e:
-                logger.error('Unexpected error while connecting to n8n: %s', str(e))
-                await self.message_queue_service.send_message(
-                    chat_id=message.chat.id,
-                    text=f'❌ Неизвестная ошибка при создании опроса.',
-                    parse_mode='Markdown',
-                    message_id=message.message_id
-                )
-                return
+        await self.n8n_queue_service.enqueue(
+            survey_data,
+            notify_chat_id=message.chat.id,
+            notify_message_id=message.message_id
+        )
+        await self._reply(message, '⏳ Опрос поставлен в очередь на создание.')
 
-    @Auth.required_admin
-    @Auth.required_not_private_chat
+    @Auth.require(admin=True, non_private=True)
     async def bind_chat_command(self, message: Message) -> None:
         """
         Command handler for /bind_chat. Binds the current chat to the database.
@@ -264,21 +242,11 @@ class AdminHandlers:
                 title=message.chat.title or 'Без названия'
             )
 
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='✅ Чат успешно привязан к базе данных.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+            await self._reply(message, '✅ Чат успешно привязан к базе данных.')
         except ChatAlreadyBoundError as e:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text=f'Не удалось привязать чат:\n{e}',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+            await self._reply(message, f'Не удалось привязать чат:\n{e}')
 
-    @Auth.required_creator
+    @Auth.require(creator=True)
     async def unbind_chat_command(self, message: Message) -> None:
         """
         Command handler for /unbind_chat. Initiates the unbinding process for the current chat.
@@ -292,12 +260,7 @@ class AdminHandlers:
         chat_exists: Chat | None = await self.chat_service.get_bound_chat()
 
         if not chat_exists:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Операция не выполнена, нет привязанного чата в базе данных.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+            await self._reply(message, '❌ Операция не выполнена, нет привязанного чата в базе данных.')
             return
 
         user_id: int = message.from_user.id
@@ -368,8 +331,7 @@ class AdminHandlers:
                 '✅ Чат успешно отвязан, все пользователи удалены.'
             )
 
-    @Auth.required_admin
-    @Auth.required_not_private_chat
+    @Auth.require(admin=True, non_private=True)
     async def bind_thread_command(self, message: Message) -> None:
         """
         Command handler for /bind_thread. Binds a thread in the current chat for survey notifications.
@@ -381,26 +343,19 @@ class AdminHandlers:
         Returns:
             None
         """
-        chat: Chat | None = await self.chat_service.get_chat_by_telegram_id(message.chat.id)
+        chat: Chat | None = await self.chat_service.get_cached_chat_by_telegram_id(message.chat.id)
 
         if not chat:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Этот чат не привязан к боту.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+            await self._reply(message, CHAT_NOT_BOUND_TEXT)
             return
 
         thread_id: int | None = message.message_thread_id
 
         if not thread_id:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Пожалуйста, вызовите эту команду в треде (ветке) чата, '
-                     'который вы хотите назначить для оповещений по опросам.',
-                parse_mode='Markdown',
-                message_id=message.message_id
+            await self._reply(
+                message,
+                '❌ Пожалуйста, вызовите эту команду в треде (ветке) чата, '
+                'который вы хотите назначить для оповещений по опросам.'
             )
             return
 
@@ -409,15 +364,9 @@ class AdminHandlers:
             thread_id=thread_id
         )
 
-        await self.message_queue_service.send_message(
-            chat_id=message.chat.id,
-            text='✅ Тред успешно назначен для оповещений по опросам.',
-            parse_mode='Markdown',
-            message_id=message.message_id
-        )
+        await self._reply(message, '✅ Тред успешно назначен для оповещений по опросам.')
 
-    @Auth.required_admin
-    @Auth.required_not_private_chat
+    @Auth.require(admin=True, non_private=True)
     async def unbind_thread_command(self, message: Message) -> None:
         """
         Command handler for /unbind_thread. Unbinds the thread in the current chat from survey notifications.
@@ -428,29 +377,19 @@ class AdminHandlers:
         Returns:
             None
         """
-        chat: Chat | None = await self.chat_service.get_chat_by_telegram_id(message.chat.id)
+        chat: Chat | None = await self.chat_service.get_cached_chat_by_telegram_id(message.chat.id)
 
         if not chat:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Этот чат не привязан к боту.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+            await self._reply(message, CHAT_NOT_BOUND_TEXT)
             return
 
         await self.chat_service.delete_thread_id(
             telegram_id=message.chat.id
         )
 
-        await self.message_queue_service.send_message(
-            chat_id=message.chat.id,
-            text='✅ Тред успешно отвязан от оповещений по опросам.',
-            parse_mode='Markdown',
-            message_id=message.message_id
-        )
+        await self._reply(message, '✅ Тред успешно отвязан от оповещений по опросам.')
 
-    @Auth.required_creator
+    @Auth.require(creator=True)
     async def add_admin_command(self, message: Message) -> None:
         """
         Command handler for /add_admin. Grants admin role to a user by their callsign.
@@ -461,60 +400,33 @@ class AdminHandlers:
         Returns:
             None
         """
-        args: list[str] = message.text.split(maxsplit=1)
-
-        if len(args) < 2 or not args[1].strip():
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Пожалуйста, укажите позывной пользователя после команды.\n'
-                     'Пример: `/add_admin позывной`',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        callsign: str | None = _parse_callsign(message.text)
+
+        if callsign is None:
+            await self._reply(message, NEED_CALLSIGN_TEMPLATE.format(command='/add_admin'))
             return
 
-        user: User | None = await self.user_service.get_user_by_callsign(args[1].strip().lower())
+        previous_role: UserRole | None = await self.user_service.change_user_role(
+            callsign=callsign,
+            from_role=UserRole.USER,
+            to_role=UserRole.ADMIN
+        )
 
-        if not user:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Пользователь не найден.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        if previous_role is None:
+            await self._reply(message, USER_NOT_FOUND_TEXT)
             return
 
-        if user.is_creator:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Нельзя сделать создателя администратором.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        if previous_role == UserRole.CREATOR:
+            await self._reply(message, '❌ Нельзя сделать создателя администратором.')
             return
 
-        if user.is_admin:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Пользователь уже является администратором.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        if previous_role != UserRole.USER:
+            await self._reply(message, '❌ Пользователь уже является администратором.')
             return
 
-        await self.user_service.set_user_role(
-            telegram_id=user.telegram_id,
-            new_role=UserRole.ADMIN
-        )
-
-        await self.message_queue_service.send_message(
-            chat_id=message.chat.id,
-            text=f'✅ Пользователь `{user.callsign.capitalize()}` успешно добавлен в администраторы.',
-            parse_mode='Markdown',
-            message_id=message.message_id
-        )
+        await self._reply(message, f'✅ Пользователь `{callsign.capitalize()}` успешно добавлен в администраторы.')
 
-    @Auth.required_creator
+    @Auth.require(creator=True)
     async def remove_admin_command(self, message: Message) -> None:
         """
         Command handler for /remove_admin. Revokes admin role from a user by their callsign.
@@ -525,60 +437,33 @@ class AdminHandlers:
         Returns:
             None
         """
-        args: list[str] = message.text.split(maxsplit=1)
-
-        if len(args) < 2 or not args[1].strip():
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Пожалуйста, укажите позывной пользователя после команды.\n'
-                     'Пример: `/remove_admin позывной`',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        callsign: str | None = _parse_callsign(message.text)
+
+        if callsign is None:
+            await self._reply(message, NEED_CALLSIGN_TEMPLATE.format(command='/remove_admin'))
             return
 
-        user: User | None = await self.user_service.get_user_by_callsign(args[1].strip().lower())
+        previous_role: UserRole | None = await self.user_service.change_user_role(
+            callsign=callsign,
+            from_role=UserRole.ADMIN,
+            to_role=UserRole.USER
+        )
 
-        if not user:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Пользователь не найден.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        if previous_role is None:
+            await self._reply(message, USER_NOT_FOUND_TEXT)
             return
 
-        if user.is_creator:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Нельзя снять роль администратора с создателя.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        if previous_role == UserRole.CREATOR:
+            await self._reply(message, '❌ Нельзя снять роль администратора с создателя.')
             return
 
-        if not user.is_admin:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Пользователь не является администратором.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+        if previous_role != UserRole.ADMIN:
+            await self._reply(message, '❌ Пользователь не является администратором.')
             return
 
-        await self.user_service.set_user_role(
-            telegram_id=user.telegram_id,
-            new_role=UserRole.USER
-        )
+        await self._reply(message, f'✅ Роль администратора у пользователя `{callsign.capitalize()}` успешно снята.')
 
-        await self.message_queue_service.send_message(
-            chat_id=message.chat.id,
-            text=f'✅ Роль администратора у пользователя `{user.callsign.capitalize()}` успешно снята.',
-            parse_mode='Markdown',
-            message_id=message.message_id
-        )
-
-    @Auth.required_admin
+    @Auth.require(admin=True)
     async def admin_list_command(self, message: Message) -> None:
         """
         Command handler for /admin_list. Sends a list of all admins with their callsigns and usernames.
@@ -592,48 +477,42 @@ class AdminHandlers:
         admin_list: list[User] | None = await self.user_service.get_users_by_role(UserRole.ADMIN)
 
         if not admin_list:
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text='❌ Администраторы не назначены.',
-                parse_mode='Markdown',
-                message_id=message.message_id
-            )
+            await self._reply(message, '❌ Администраторы не назначены.')
             return
 
-        admin_lines: list[str] = []
-
-        for idx, admin in enumerate(admin_list, 1):
-            if admin.username:
-                line = f'{idx}. [{admin.callsign.capitalize()}](https://t.me/{admin.username})'
-            else:
-                line = f'{idx}. `{admin.callsign.capitalize()}`'
-            admin_lines.append(line)
+        admin_lines: list[str] = [
+            f'{idx}. [{admin.callsign.capitalize()}](https://t.me/{admin.username})'
+            if admin.username else
+            f'{idx}. `{admin.callsign.capitalize()}`'
+            for idx, admin in enumerate(admin_list, 1)
+        ]
 
-        mas_message_length: int = 4096
+        max_message_length: int = 4096
         header: str = '👮‍♂️ *Список администраторов:*\n\n'
-        chunk: str = header
+        chunks: list[str] = []
+        chunk_lines: list[str] = []
+        chunk_length: int = len(header)
 
+        # Lines are packed greedily and joined once per message, the header goes only to the first one
         for line in admin_lines:
-            line_with_newline: str = line + '\n'
-            if len(chunk) + len(line_with_newline) > mas_message_length:
-                await self.message_queue_service.send_message(
-                    chat_id=message.chat.id,
-                    text=chunk.rstrip(),
-                    parse_mode='Markdown',
-                    disable_web_page_preview=True,
-                    message_id=message.message_id
-                )
-                chunk = ''
-            if not chunk:
-                chunk = line_with_newline
-            else:
-                chunk += line_with_newline
-
-        if chunk.strip():
-            await self.message_queue_service.send_message(
-                chat_id=message.chat.id,
-                text=chunk.rstrip(),
-                parse_mode='Markdown',
-                disable_web_page_preview=True,
-                message_id=message.message_id
-            )
+            line_length: int = len(line) + 1
+            if chunk_lines and chunk_length + line_length > max_message_length:
+                chunks.append(('' if chunks else header) + '\n'.join(chunk_lines))
+                chunk_lines = []
+                chunk_length = 0
+            chunk_lines.append(line)
+            chunk_length += line_length
+
+        chunks.append(('' if chunks else header) + '\n'.join(chunk_lines))
+
+        # All chunks go out as one batch task, so they are sent in order within one bot session
+        await self.message_queue_service.send_many([
+            {
+                'chat_id': message.chat.id,
+                'text': chunk,
+                'parse_mode': 'Markdown',
+                'disable_web_page_preview': True,
+                'message_id': message.message_id
+            }
+            for chunk in chunks
+        ])
@@ -1,12 +1,46 @@
-from aiogram import Bot
+import asyncio
+
 from aiogram import Router
 from aiogram.filters import ChatMemberUpdatedFilter, IS_MEMBER, IS_NOT_MEMBER
 from aiogram.types import ChatMemberUpdated, User as TelegramUser, Chat as TelegramChat
 
-from app.models import UserRole, Chat, User
+from app.models import Chat, User
 from app.services import UserService, ChatService, PenaltyService, MessageQueueService
 from app.utils import escape_markdown
 
+JOIN_FILTER: ChatMemberUpdatedFilter = ChatMemberUpdatedFilter(member_status_changed=IS_NOT_MEMBER >> IS_MEMBER)
+LEAVE_FILTER: ChatMemberUpdatedFilter = ChatMemberUpdatedFilter(member_status_changed=IS_MEMBER >> IS_NOT_MEMBER)
+
+SURVEY_RULES_TEXT: str = (
+    'Вовремя проходите опросы, о которых оповещает бот, '
+    'чтобы не получить штрафные баллы.\n'
+    'Если накопите 3 штрафных балла за пол года, вы будете '
+    'исключены из команды без права возврата. Каждое 01 января '
+    'и 01 июля штрафные баллы сбрасываются автоматически.\n\n'
+    'В исключительных случаях, когда вы не сможете проходить опросы, '
+    'сообщите об этом командиру команды или заместителю, вам '
+    'выдадут бронь от прохождения опросов.'
+)
+JOIN_REGISTERED_TEMPLATE: str = (
+    'Добро пожаловать в чат, {name}!\n\n'
+    'Вы уже зарегистрированы в боте, поэтому вам доступны '
+    'все слэш-команды. Справка доступна через вызов '
+    '`/help`.\n\n'
+) + SURVEY_RULES_TEXT
+JOIN_UNREGISTERED_TEMPLATE: str = (
+    'Добро пожаловать в чат, {name}!\n\n'
+    'Вы еще не зарегистрированы в боте, поэтому вам необходимо '
+    'пройти регистрацию, используя команду:\n\n'
+    '`/reg позывной`\n\n'
+    'Позывной не должен содержать ничего, кроме латинских букв, '
+    'и быть длиннее 20 символов.\n\n'
+    'Если вы проигнорируете регистрацию в течение 24 часов с момента '
+    'вступления в чат, вы будете удалены из него командиром команды и '
+    'ваше вступление в команду будет аннулировано.\n\n'
+    'После регистрации вам станут доступны все слэш-команды бота, '
+    'узнать о которых вы можете, вызвав команду `/help`.\n\n'
+) + SURVEY_RULES_TEXT
+
 
 class SystemHandlers:
     """
@@ -40,47 +74,43 @@ class SystemHandlers:
         Returns:
             None
         """
-        self.router.chat_member.register(
-            self.on_user_join,
-            ChatMemberUpdatedFilter(
-                member_status_changed=IS_NOT_MEMBER >> IS_MEMBER)
-        )
-
-        self.router.chat_member.register(
-            self.on_user_leave,
-            ChatMemberUpdatedFilter(
-                member_status_changed=IS_MEMBER >> IS_NOT_MEMBER)
-        )
+        self.router.chat_member.register(self.on_user_join, JOIN_FILTER)
+        self.router.chat_member.register(self.on_user_leave, LEAVE_FILTER)
 
     async def _extract_event_context(
             self,
             event: ChatMemberUpdated,
             is_join: bool = True
-    ) -> tuple[TelegramUser, TelegramChat, Bot, User | None] | None:
+    ) -> tuple[TelegramUser, TelegramChat, User | None] | None:
         """
-        Extract user, chat, bot, and user existence from the event.
+        Extract user, chat and user existence from the event.
 
         Args:
             event (ChatMemberUpdated): The chat member update event.
             is_join (bool): Flag indicating if the event is a join event.
         
         Returns:
-            tuple: (user, chat, bot, user_exists) or None if chat doesn't exist or user is a bot.
+            tuple: (user, chat, user_exists) or None if chat doesn't exist or user is a bot.
         """
         if is_join:
             user: TelegramUser = event.new_chat_member.user
         else:
             user: TelegramUser = event.old_chat_member.user
         chat: TelegramChat = event.chat
-        bot: Bot = event.bot
 
-        chat_exists: Chat | None = await self.chat_service.get_chat_by_telegram_id(chat.id)
-        if not chat_exists or user.is_bot:
+        if user.is_bot:
             return None
 
-        user_exists: User | None = await self.user_service.get_user_by_telegram_id(user.id)
+        chat_exists: Chat | None
+        user_exists: User | None
+        chat_exists, user_exists = await asyncio.gather(
+            self.chat_service.get_cached_chat_by_telegram_id(chat.id),
+            self.user_service.get_user_by_telegram_id(user.id)
+        )
+        if not chat_exists:
+            return None
 
-        return user, chat, bot, user_exists
+        return user, chat, user_exists
 
     async def on_user_join(self, event: ChatMemberUpdated) -> None:
         """
@@ -92,64 +122,35 @@ class SystemHandlers:
         Returns:
             None
         """
-        result: tuple[TelegramUser, TelegramChat, Bot, User | None] = \
+        result: tuple[TelegramUser, TelegramChat, User | None] = \
             await self._extract_event_context(event, is_join=True)
         if not result:
             return
 
         user: TelegramUser
         chat: TelegramChat
-        bot: Bot
         user_exists: User | None
 
-        user, chat, bot, user_exists = result
+        user, chat, user_exists = result
 
         if user_exists:
             # Reactivate user if they were previously deactivated
-            # This can happen if they left/banned and rejoined the chat
-            await self.user_service.activate_user(telegram_id=user.id)
-            # Remove all penalties upon rejoining
-            await self.penalty_service.delete_user_penalties(user=user_exists)
-
-            await self.message_queue_service.send_message(
-                chat_id=chat.id,
-                text=f'Добро пожаловать в чат, {escape_markdown(user_exists.callsign.capitalize())}!\n\n'
-                     f'Вы уже зарегистрированы в боте, поэтому вам доступны '
-                     f'все слэш-команды. Справка доступна через вызов '
-                     f'`/help`.\n\n'
-                     f'Вовремя проходите опросы, о которых оповещает бот, '
-                     f'чтобы не получить штрафные баллы.\n'
-                     f'Если накопите 3 штрафных балла за пол года, вы будете '
-                     f'исключены из команды без права возврата. Каждое 01 января '
-                     f'и 01 июля штрафные баллы сбрасываются автоматически.\n\n'
-                     f'В исключительных случаях, когда вы не сможете проходить опросы, '
-                     f'сообщите об этом командиру команды или заместителю, вам '
-                     f'выдадут бронь от прохождения опросов.',
-                parse_mode='Markdown'
+            # This can happen if they left/banned and rejoined the chat.
+            # All penalties are removed upon rejoining. Both writes and the greeting are independent.
+            await asyncio.gather(
+                self.user_service.activate_user(telegram_id=user.id),
+                self.penalty_service.delete_user_penalties(user=user_exists),
+                self.message_queue_service.send_message(
+                    chat_id=chat.id,
+                    text=JOIN_REGISTERED_TEMPLATE.format(name=escape_markdown(user_exists.callsign.capitalize())),
+                    parse_mode='Markdown'
+                )
             )
 
         if not user_exists:
             await self.message_queue_service.send_message(
                 chat_id=chat.id,
-                text=f'Добро пожаловать в чат, {escape_markdown(user.full_name)}!\n\n'
-                     f'Вы еще не зарегистрированы в боте, поэтому вам необходимо '
-                     f'пройти регистрацию, используя команду:\n\n'
-                     f'`/reg позывной`\n\n'
-                     f'Позывной не должен содержать ничего, кроме латинских букв, '
-                     f'и быть длиннее 20 символов.\n\n'
-                     f'Если вы проигнорируете регистрацию в течение 24 часов с момента '
-                     f'вступления в чат, вы будете удалены из него командиром команды и '
-                     f'ваше вступление в команду будет аннулировано.\n\n'
-                     f'После регистрации вам станут доступны все слэш-команды бота, '
-                     f'узнать о которых вы можете, вызвав команду `/help`.\n\n'
-                     f'Вовремя проходите опросы, о которых оповещает бот, '
-                     f'чтобы не получить штрафные баллы.\n'
-                     f'Если накопите 3 штрафных балла за пол года, вы будете '
-                     f'исключены из команды без права возврата. Каждое 01 января '
-                     f'и 01 июля штрафные баллы сбрасываются автоматически.\n\n'
-                     f'В исключительных случаях, когда вы не сможете проходить опросы, '
-                     f'сообщите об этом командиру команды или заместителю, вам '
-                     f'выдадут бронь от прохождения опросов.',
+                text=JOIN_UNREGISTERED_TEMPLATE.format(name=escape_markdown(user.full_name)),
                 parse_mode='Markdown'
             )
 
@@ -163,31 +164,26 @@ class SystemHandlers:
         Returns:
             None
         """
-        result: tuple[TelegramUser, TelegramChat, Bot, User | None] = \
+        result: tuple[TelegramUser, TelegramChat, User | None] = \
             await self._extract_event_context(event, is_join=False)
         if not result:
             return
 
         user: TelegramUser
         chat: TelegramChat
-        bot: Bot
         user_exists: User | None
 
-        user, chat, bot, user_exists = result
+        user, chat, user_exists = result
 
         if not user_exists:
             text: str = f'{escape_markdown(user.full_name)} удален(а) из чата.'
         else:
             text: str = f'`{escape_markdown(user_exists.callsign.capitalize())}` удален(а) из чата.'
 
-        await self.user_service.deactivate_user(telegram_id=user.id)
-
-        await self.user_service.set_user_role(
-            telegram_id=user.id,
-            new_role=UserRole.USER
-        )
+        if user_exists:
+            await self.user_service.deactivate_and_reset_role(telegram_id=user.id)
 
-        await self.message_queue_service.send_message(
+        await self.message_queue_service.schedule_message(
             chat_id=chat.id,
             text=text,
             parse_mode='Markdown'
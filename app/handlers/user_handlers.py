@@ -6,6 +6,7 @@ from zoneinfo import ZoneInfo
 from aiogram import Router
 from aiogram.filters import Command, CommandStart
 from aiogram.types import Message
+from tortoise.exceptions import IntegrityError
 
 from app.decorators import AuthDecorators as Auth
 from app.decorators import CallsignDecorators as Callsign
@@ -18,6 +19,40 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+START_TEXT: str = (
+    '🚀 _"Стартуем!"_\n\n'
+    '👋 Добро пожаловать в бот управления опросами!\n\n'
+    'Справка по всем командам вызывается через:\n'
+    '`/help`\n\n'
+    'Основной функционал бота доступен только после регистрации, а '
+    'зарегистрироваться можно только в привязанном к боту чате.'
+)
+# A concurrent /reg or /update can pass the validation and still hit a unique constraint
+REG_CONFLICT_TEXT: str = '❌ Позывной уже занят или вы уже зарегистрированы в системе.'
+CALLSIGN_TAKEN_TEXT: str = '❌ Позывной уже занят. Пожалуйста, выберите другой.'
+HELP_TEXT: str = (
+    '📋 Доступные команды:\n\n'
+    '👤 Пользователь:\n'
+    '• `/reg позывной` - Регистрация в системе\n'
+    '• `/update позывной` - Обновить позывной или данные профиля\n'
+    '• `/profile` - Посмотреть информацию о себе\n'
+    '• `/surveys` - Список активных опросов\n'
+    '• `/my_penalties` - Показать мои штрафные баллы\n'
+    '• `/help` - Показать эту справку\n\n'
+    '🔧 Администратор:\n'
+    '• `/reserve позывной` - Повесить или снять бронь на прохождение опросов '
+    'для конкретного пользователя\n'
+    '• `/create_survey название + YYYY-MM-DD HH:MM` - Создать опрос\n'
+    '• `/bind_chat` - Привязать чат к боту\n'
+    '• `/bind_thread` - Назначить топик для оповещений по опросам\n'
+    '• `/unbind_thread` - Отвязать топик для оповещений по опросам\n'
+    '• `/admin_list` - Показать список администраторов\n\n'
+    '👑 Создатель:\n'
+    '• `/unbind_chat` - Отвязать чат от бота\n'
+    '• `/add_admin позывной` - Добавить администратора\n'
+    '• `/remove_admin позывной` - Убрать администратора'
+)
+
 
 class UserHandlers:
     """
@@ -37,7 +72,7 @@ class UserHandlers:
         start_command(message): Handles the /start command.
         help_command(message): Handles the /help command.
         register_command(message, callsign): Handles the /reg command for user registration.
-        update_command(message): Handles the /update command for updating user profile.
+        update_command(message, callsign): Handles the /update command for updating user profile.
         profile_command(message): Handles the /profile command to show user profile.
         surveys_command(message): Handles the /surveys command to list active surveys.
     """
@@ -78,17 +113,9 @@ class UserHandlers:
         Returns:
             None
         """
-        start_text: str = (
-            '🚀 _"Стартуем!"_\n\n'
-            '👋 Добро пожаловать в бот управления опросами!\n\n'
-            'Справка по всем командам вызывается через:\n'
-            '`/help`\n\n'
-            'Основной функционал бота доступен только после регистрации, а '
-            'зарегистрироваться можно только в привязанном к боту чате.'
-        )
         await self.message_queue_service.send_message(
             chat_id=message.chat.id,
-            text=start_text,
+            text=START_TEXT,
             parse_mode='Markdown'
         )
 
@@ -102,40 +129,16 @@ class UserHandlers:
         Returns:
             None
         """
-        help_text: str = (
-            '📋 Доступные команды:\n\n'
-            '👤 Пользователь:\n'
-            '• `/reg позывной` - Регистрация в системе\n'
-            '• `/update позывной` - Обновить позывной или данные профиля\n'
-            '• `/profile` - Посмотреть информацию о себе\n'
-            '• `/surveys` - Список активных опросов\n'
-            '• `/my_penalties` - Показать мои штрафные баллы\n'
-            '• `/help` - Показать эту справку\n\n'
-            '🔧 Администратор:\n'
-            '• `/reserve позывной` - Повесить или снять бронь на прохождение опросов '
-            'для конкретного пользователя\n'
-            '• `/create_survey название + YYYY-MM-DD HH:MM` - Создать опрос\n'
-            '• `/bind_chat` - Привязать чат к боту\n'
-            '• `/bind_thread` - Назначить топик для оповещений по опросам\n'
-            '• `/unbind_thread` - Отвязать топик для оповещений по опросам\n'
-            '• `/admin_list` - Показать список администраторов\n\n'
-            '👑 Создатель:\n'
-            '• `/unbind_chat` - Отвязать чат от бота\n'
-            '• `/add_admin позывной` - Добавить администратора\n'
-            '• `/remove_admin позывной` - Убрать администратора'
-        )
-
         await self.message_queue_service.send_message(
             chat_id=message.chat.id,
-            text=help_text,
+            text=HELP_TEXT,
             parse_mode='Markdown',
             message_id=message.message_id
         )
 
-    @Auth.required_not_private_chat
-    @Auth.required_chat_bind
+    @Auth.require(non_private=True, chat_bound=True)
     @Callsign.validate_callsign_create
-    async def register_command(self, message: Message, callsign: str) -> None:
+    async def register_command(self, message: Message, *, callsign: str) -> None:
         """
         Command handler for /reg. Registers a new user with the provided callsign.
 
@@ -186,6 +189,14 @@ class UserHandlers:
                 message_id=message.message_id
             )
 
+        except IntegrityError as ie:
+            logger.warning('Registration conflict for user %s: %s', message.from_user.id, str(ie))
+            await self.message_queue_service.send_message(
+                chat_id=message.chat.id,
+                text=REG_CONFLICT_TEXT,
+                parse_mode='Markdown',
+                message_id=message.message_id
+            )
         except ValueError as ve:
             logger.error('ValueError during registration: %s', str(ve))
             await self.message_queue_service.send_message(
@@ -203,15 +214,17 @@ class UserHandlers:
                 message_id=message.message_id
             )
 
-    @Auth.required_user_registration
+    @Auth.require(pass_user=True)
     @Callsign.validate_callsign_update
-    async def update_command(self, message: Message) -> None:
+    async def update_command(self, message: Message, *, callsign: str | None, user: User) -> None:
         """
         Command handler for /update. Updates the user's profile information.
         If a callsign is provided, updates it as well.
 
         Args:
             message (Message): Incoming message from the user.
+            callsign (str | None): The validated new callsign or None if it was not provided.
+            user (User): The registered user loaded by the auth check.
 
         Returns:
             None
@@ -219,8 +232,6 @@ class UserHandlers:
         try:
             data: dict[str, str | datetime | None] = {}
 
-            user: User = await self.user_service.get_user_by_telegram_id(message.from_user.id)
-
             data['first_name'] = (message.from_user.first_name.lower()
                                   if message.from_user.first_name else None)
             data['last_name'] = (message.from_user.last_name.lower()
@@ -229,10 +240,8 @@ class UserHandlers:
                                 if message.from_user.username else None)
             data['updated_at'] = datetime.now(tz=self.tz)
 
-            args: list[str] = message.text.split()
-
-            if len(args) >= 2:
-                data['callsign'] = args[1].lower()
+            if callsign:
+                data['callsign'] = callsign.lower()
 
             await self.user_service.update_user(user.telegram_id, **data)
 
@@ -243,6 +252,14 @@ class UserHandlers:
                 message_id=message.message_id
             )
 
+        except IntegrityError as ie:
+            logger.warning('Callsign conflict while updating user %s: %s', message.from_user.id, str(ie))
+            await self.message_queue_service.send_message(
+                chat_id=message.chat.id,
+                text=CALLSIGN_TAKEN_TEXT,
+                parse_mode='Markdown',
+                message_id=message.message_id
+            )
         except ValueError as ve:
             await self.message_queue_service.send_message(
                 chat_id=message.chat.id,
@@ -259,19 +276,18 @@ class UserHandlers:
                 message_id=message.message_id
             )
 
-    @Auth.required_user_registration
-    async def profile_command(self, message: Message) -> None:
+    @Auth.require(pass_user=True)
+    async def profile_command(self, message: Message, *, user: User) -> None:
         """
         Command handler for /profile. Sends user profile information.
 
         Args:
             message (Message): Incoming message from the user.
+            user (User): The registered user loaded by the auth check.
         
         Returns:
             None
         """
-        user: User = await self.user_service.get_user_by_telegram_id(message.from_user.id)
-
         profile_text: str = (
             f'👤 *Профиль пользователя*\n\n'
             f'🆔 Позывной: `{escape_markdown(user.callsign.capitalize())}`\n'
@@ -293,8 +309,7 @@ class UserHandlers:
             message_id=message.message_id
         )
 
-    @Auth.required_chat_bind
-    @Auth.required_user_registration
+    @Auth.require(chat_bound=True, registered=True)
     async def surveys_command(self, message: Message) -> None:
         """
         Command handler for /surveys. Sends a list of active surveys.
@@ -302,7 +317,7 @@ class UserHandlers:
         :param message: Message - incoming message from the user
         :return: None
         """
-        active_surveys: list[Survey] | None = await self.survey_service.get_active_surveys()
+        active_surveys: list[Survey] = await self.survey_service.get_cached_active_surveys()
 
         if not active_surveys:
             await self.message_queue_service.send_message(
@@ -313,15 +328,14 @@ class UserHandlers:
             )
             return
 
-        surveys_text: str = '📋 *Активные опросы:*\n\n'
-        for survey in active_surveys:
-            surveys_text += (
-                f'• *{survey.title}*\n'
-                f'  🔗 [Перейти к опросу]({survey.form_url})\n'
-                f'  🕒 Завершение: {survey.ended_at.astimezone(
-                    tz=self.tz
-                ).strftime(self._datetime_format)}\n\n'
-            )
+        tz: ZoneInfo = self.tz
+        datetime_format: str = self._datetime_format
+        surveys_text: str = '📋 *Активные опросы:*\n\n' + ''.join(
+            f'• *{survey.title}*\n'
+            f'  🔗 [Перейти к опросу]({survey.form_url})\n'
+            f'  🕒 Завершение: {survey.ended_at.astimezone(tz=tz).strftime(datetime_format)}\n\n'
+            for survey in active_surveys
+        )
 
         await self.message_queue_service.send_message(
             chat_id=message.chat.id,
@@ -331,18 +345,18 @@ class UserHandlers:
             message_id=message.message_id
         )
 
-    @Auth.required_user_registration
-    async def my_penalties_command(self, message: Message) -> None:
+    @Auth.require(pass_user=True)
+    async def my_penalties_command(self, message: Message, *, user: User) -> None:
         """
         Command handler for /my_penalties. Sends a list of user's penalties.
 
         Args:
             message (Message): Incoming message from the user.
+            user (User): The registered user loaded by the auth check.
 
         Returns:
             None
         """
-        user: User = await self.user_service.get_user_by_telegram_id(message.from_user.id)
         users_penalties: list[Penalty] = await self.penalty_service.get_user_penalties(user=user)
 
         if not users_penalties:
@@ -4,6 +4,7 @@ from .survey_service import SurveyService
 from .penalty_service import PenaltyService
 from .survey_template_service import SurveyTemplateService
 from .message_queue_service import MessageQueueService
+from .n8n_queue_service import N8nQueueService
 
 __all__ = [
     'UserService',
@@ -12,5 +13,6 @@ __all__ = [
     'SurveyService',
     'PenaltyService',
     'SurveyTemplateService',
-    'MessageQueueService'
+    'MessageQueueService',
+    'N8nQueueService'
 ]
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class BatchQueue(Generic[T]):
+    """
+    In-process queue that hands its items to a flush callback in batches.
+    A batch is collected for up to `interval` seconds after the worker picks up
+    its first item, or until `max_size` items are pending. The worker task is started
+    on the first put in the running event loop and restarted if it has stopped;
+    pending items are kept in the queue across restarts.
+
+    Methods:
+        put: Add item to the queue
+        stop: Stop the worker and return the pending items
+    """
+
+    def __init__(self, flush: Callable[[list[T]], Awaitable[object]], interval: float, max_size: int):
+        """
+        Args:
+            flush (Callable): Coroutine function that receives each batch
+            interval (float): Maximum time in seconds to collect a batch
+            max_size (int): Maximum number of items in a batch
+        """
+        self.flush: Callable[[list[T]], Awaitable[object]] = flush
+        self.interval: float = interval
+        self.max_size: int = max_size
+        self._items: deque[T] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._worker: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: T) -> None:
+        """
+        Add item to the queue and wake up the worker.
+
+        Args:
+            item (T): Item for the next batch
+
+        Returns:
+            None
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._worker = loop.create_task(self._run())
+
+        self._items.append(item)
+        self._wakeup.set()
+
+    def stop(self) -> list[T]:
+        """
+        Stop the worker and take the items that have not been flushed yet.
+
+        Returns:
+            List of pending items
+        """
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+
+        self._worker = None
+        pending: list[T] = list(self._items)
+        self._items.clear()
+
+        return pending
+
+    async def _run(self) -> None:
+        """
+        Collect pending items into batches and pass each batch to the flush callback.
+
+        Returns:
+            None
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            if not self._items:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            deadline: float = loop.time() + self.interval
+
+            while len(self._items) < self.max_size:
+                timeout: float = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except TimeoutError:
+                    break
+
+            batch: list[T] = [self._items.popleft() for _ in range(min(len(self._items), self.max_size))]
+
+            try:
+                await self.flush(batch)
+            except Exception as e:
+                logger.error('Error flushing a batch of %s items: %s', len(batch), str(e))
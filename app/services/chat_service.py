@@ -1,7 +1,14 @@
+import time
+
 from tortoise.transactions import in_transaction
 
 from app.models import Chat
 
+# Bound chats are looked up by the auth checks of most commands, so found chats
+# are cached for CHAT_CACHE_TTL seconds and evicted when the binding changes.
+CHAT_CACHE_TTL: float = 30.0
+_CHAT_CACHE: dict[int, tuple[float, Chat]] = {}
+
 
 class ChatAlreadyBoundError(Exception):
     """
@@ -18,6 +25,8 @@ class ChatService:
     Methods:
         get_bound_chat: Gets the currently bound chat.
         get_chat_by_telegram_id: Gets a chat by its Telegram ID.
+        get_cached_chat_by_telegram_id: Gets a chat by its Telegram ID through the in-memory cache.
+        clear_chat_cache: Clears the in-memory chat cache.
         bind_chat: Binds only one chat to the database. If there is already a bound chat, raises ChatAlreadyBoundError.
         unbind_chat: Unbinds a chat by its Telegram ID.
         set_thread_id: Sets the thread ID for the chat.
@@ -49,6 +58,43 @@ class ChatService:
         """
         return await Chat.filter(telegram_id=telegram_id).first()
 
+    @staticmethod
+    async def get_cached_chat_by_telegram_id(
+            telegram_id: int
+    ) -> Chat | None:
+        """
+        Gets a chat by its Telegram ID through the in-memory cache.
+        Found chats are cached for CHAT_CACHE_TTL seconds,
+        missing chats are not cached.
+
+        Args:
+            telegram_id (int): Telegram chat ID
+
+        Returns:
+            Chat object or None if not found
+        """
+        now: float = time.monotonic()
+        cached: tuple[float, Chat] | None = _CHAT_CACHE.get(telegram_id)
+
+        if cached and cached[0] > now:
+            return cached[1]
+
+        chat: Chat | None = await ChatService.get_chat_by_telegram_id(telegram_id)
+        if chat:
+            _CHAT_CACHE[telegram_id] = (now + CHAT_CACHE_TTL, chat)
+
+        return chat
+
+    @staticmethod
+    def clear_chat_cache() -> None:
+        """
+        Clears the in-memory chat cache.
+
+        Returns:
+            None
+        """
+        _CHAT_CACHE.clear()
+
     @staticmethod
     async def bind_chat(
             telegram_id: int,
@@ -82,6 +128,7 @@ class ChatService:
                 chat_type=chat_type,
                 title=title
             )
+            _CHAT_CACHE.pop(telegram_id, None)
 
             return chat
 
@@ -93,7 +140,10 @@ class ChatService:
         Returns:
             Number of deleted chats
         """
-        return await Chat.all().delete()
+        deleted_count: int = await Chat.all().delete()
+        _CHAT_CACHE.clear()
+
+        return deleted_count
 
     async def set_thread_id(
             self,
@@ -116,6 +166,7 @@ class ChatService:
 
         chat.thread_id = thread_id
         await chat.save()
+        _CHAT_CACHE.pop(telegram_id, None)
         return True
 
     async def delete_thread_id(
@@ -137,4 +188,5 @@ class ChatService:
 
         chat.thread_id = None
         await chat.save()
+        _CHAT_CACHE.pop(telegram_id, None)
         return True
@@ -1,19 +1,32 @@
 import logging
 import traceback
 
-from aiogram.types import InlineKeyboardMarkup
+from aiogram.types import InlineKeyboardMarkup, MessageEntity
 from celery.result import AsyncResult
 
 from app.celery_app import celery_app
 from app.celery_tasks.telegram_tasks import (
     send_telegram_message as celery_send_telegram_message,
+    send_telegram_message_batch as celery_send_telegram_message_batch,
     send_bulk_messages as celery_send_bulk_messages,
     send_and_pin_telegram_message
 )
 from app.schemas import QueueResult, TaskStatus
+from app.services.batch_queue import BatchQueue
 
 logger = logging.getLogger(__name__)
 
+# Error replies are collected for up to ERROR_BATCH_INTERVAL seconds
+# or until ERROR_BATCH_MAX_SIZE of them are pending, then queued as one task.
+ERROR_BATCH_INTERVAL: float = 0.05
+ERROR_BATCH_MAX_SIZE: int = 10
+
+# Scheduled messages are collected for up to COALESCE_INTERVAL seconds
+# or until COALESCE_MAX_LINES of them are pending; messages for the same chat
+# are joined line by line and queued as one task.
+COALESCE_INTERVAL: float = 1.0
+COALESCE_MAX_LINES: int = 20
+
 
 class MessageQueueService:
     """
@@ -23,6 +36,10 @@ class MessageQueueService:
         send_message: Add message to queue for sending
         send_and_pin_message: Add message to queue for sending and pinning
         send_bulk_messages: Add multiple messages to queue for sending
+        send_many: Add multiple messages to queue as a single batch task
+        enqueue_error: Add error reply to the batch of pending error replies
+        schedule_message: Add message to be joined with other messages for the same chat
+        close: Queue the pending error replies and scheduled messages right away
         get_task_status: Get task status
     """
 
@@ -164,6 +181,144 @@ class MessageQueueService:
                 message=str(e)
             )
 
+    @staticmethod
+    async def send_many(messages: list[dict]) -> QueueResult:
+        """
+        Add multiple messages to queue as a single batch task.
+        Unlike send_bulk_messages, the messages are sent within one bot session
+        without delays between them.
+
+        Args:
+            messages (list[dict]): List of message dicts with keys: chat_id, text, parse_mode, message_id, entities
+
+        Returns:
+            dict: Result of adding to queue
+        """
+        try:
+            task: AsyncResult = celery_send_telegram_message_batch.delay(messages)
+
+            logger.info('Message batch queued, task ID: %s, count: %s', task.id, len(messages))
+
+            return QueueResult(
+                status='queued',
+                task_id=task.id,
+                message_count=len(messages)
+            )
+
+        except Exception as e:
+            logger.error('Error queuing message batch: %s\n%s', str(e), traceback.format_exc())
+            return QueueResult(
+                status='error',
+                message=str(e)
+            )
+
+    @classmethod
+    async def enqueue_error(
+            cls,
+            chat_id: int,
+            text: str,
+            parse_mode: str | None = 'HTML',
+            message_id: int | None = None,
+            entities: list[MessageEntity] | None = None
+    ) -> QueueResult:
+        """
+        Add error reply to the batch of pending error replies.
+        The batch is queued through send_many.
+
+        Args:
+            chat_id (int): Chat ID
+            text (str): Message text
+            parse_mode (str | None): Parse mode, None when entities are provided
+            message_id (int | None): If provided, reply to this message ID
+            entities (list[MessageEntity] | None): Message entities, used instead of parse_mode
+
+        Returns:
+            dict: Result of adding to the batch
+        """
+        _ERROR_QUEUE.put({
+            'chat_id': chat_id,
+            'text': text,
+            'parse_mode': parse_mode,
+            'message_id': message_id,
+            'entities': [entity.model_dump(exclude_none=True) for entity in entities] if entities else None
+        })
+
+        return QueueResult(
+            status='queued',
+            chat_id=chat_id
+        )
+
+    @classmethod
+    async def schedule_message(
+            cls,
+            chat_id: int,
+            text: str,
+            parse_mode: str = 'HTML'
+    ) -> QueueResult:
+        """
+        Add message to be joined with other messages for the same chat.
+        Messages scheduled within COALESCE_INTERVAL seconds are sent as one message
+        per chat, one line per scheduled message. The messages are queued through send_many.
+
+        Args:
+            chat_id (int): Chat ID
+            text (str): Message text, a single line
+            parse_mode (str): Parse mode, messages are joined only with the same parse mode
+
+        Returns:
+            dict: Result of adding to the pending messages
+        """
+        _COALESCE_QUEUE.put((chat_id, parse_mode, text))
+
+        return QueueResult(
+            status='queued',
+            chat_id=chat_id
+        )
+
+    @classmethod
+    async def _send_coalesced(cls, batch: list[tuple[int, str, str]]) -> None:
+        """
+        Join a batch of scheduled messages per chat and queue the result as one batch.
+
+        Args:
+            batch (list[tuple[int, str, str]]): Scheduled messages as (chat_id, parse_mode, text)
+
+        Returns:
+            None
+        """
+        lines: dict[tuple[int, str], list[str]] = {}
+        for chat_id, parse_mode, text in batch:
+            lines.setdefault((chat_id, parse_mode), []).append(text)
+
+        await cls.send_many([
+            {'chat_id': chat_id, 'text': '\n'.join(texts), 'parse_mode': parse_mode}
+            for (chat_id, parse_mode), texts in lines.items()
+        ])
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Stop the batch queues and queue their pending messages right away,
+        so they are not lost on shutdown.
+
+        Returns:
+            None
+        """
+        pending_errors: list[dict] = _ERROR_QUEUE.stop()
+        pending_lines: list[tuple[int, str, str]] = _COALESCE_QUEUE.stop()
+
+        if pending_errors:
+            await cls.send_many(pending_errors)
+
+        for start in range(0, len(pending_lines), COALESCE_MAX_LINES):
+            await cls._send_coalesced(pending_lines[start:start + COALESCE_MAX_LINES])
+
+        if pending_errors or pending_lines:
+            logger.info(
+                'Queued %s pending error replies and %s scheduled messages on shutdown',
+                len(pending_errors), len(pending_lines)
+            )
+
     @staticmethod
     def get_task_status(task_id: str) -> TaskStatus:
         """
@@ -191,3 +346,16 @@ class MessageQueueService:
                 status='error',
                 message=str(e)
             )
+
+
+# Pending error replies and scheduled messages, queued through send_many in batches
+_ERROR_QUEUE: BatchQueue[dict] = BatchQueue(
+    flush=MessageQueueService.send_many,
+    interval=ERROR_BATCH_INTERVAL,
+    max_size=ERROR_BATCH_MAX_SIZE
+)
+_COALESCE_QUEUE: BatchQueue[tuple[int, str, str]] = BatchQueue(
+    flush=MessageQueueService._send_coalesced,
+    interval=COALESCE_INTERVAL,
+    max_size=COALESCE_MAX_LINES
+)
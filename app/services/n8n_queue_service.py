@@ -0,0 +1,223 @@
+import asyncio
+import logging
+
+import aiohttp
+
+from app.schemas import QueueResult, SurveyData
+from app.services.batch_queue import BatchQueue
+from app.services.message_queue_service import MessageQueueService
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+N8N_TIMEOUT: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=10, connect=3)
+N8N_MAX_ATTEMPTS: int = 3
+N8N_RETRY_BACKOFF: float = 0.5
+CREATE_SURVEY_WEBHOOK_PATH: str = '/webhook/create-google-form'
+JSON_HEADERS: dict[str, str] = {'Content-Type': 'application/json'}
+# Only the beginning of a response body is kept for logging
+N8N_RESPONSE_BODY_LIMIT: int = 4000
+
+# Surveys queued within N8N_BATCH_INTERVAL seconds of each other are posted
+# concurrently over the shared session, up to N8N_BATCH_MAX_SIZE at a time.
+N8N_BATCH_INTERVAL: float = 0.05
+N8N_BATCH_MAX_SIZE: int = 5
+
+SURVEY_CREATED_TEXT: str = '✅ Опрос успешно отправлен в n8n для создания!'
+SURVEY_REJECTED_TEXT: str = '❌ Не удалось отправить опрос на создание. Попробуйте еще раз позже.'
+CONNECTION_ERROR_TEXT: str = '❌ Ошибка при подключении к n8n. Попробуйте еще раз.'
+UNKNOWN_ERROR_TEXT: str = '❌ Неизвестная ошибка при создании опроса.'
+
+
+class N8nQueueService:
+    """
+    Service for delivering surveys to n8n in the background.
+    Surveys are put in an in-process batch queue and posted concurrently in small batches
+    over a shared keep-alive HTTP session. The result is reported to the chat
+    that requested the survey through MessageQueueService.
+
+    Methods:
+        enqueue: Add survey to the delivery queue
+        close: Stop the worker and close the HTTP session
+    """
+
+    _http_session: aiohttp.ClientSession | None = None
+
+    @classmethod
+    async def enqueue(
+            cls,
+            survey_data: SurveyData,
+            notify_chat_id: int,
+            notify_message_id: int | None = None
+    ) -> QueueResult:
+        """
+        Add survey to the delivery queue.
+        The survey is encoded to JSON once here, so retries post the same bytes.
+
+        Args:
+            survey_data (SurveyData): Survey to create in n8n
+            notify_chat_id (int): Chat ID for the delivery result
+            notify_message_id (int | None): If provided, the result replies to this message ID
+
+        Returns:
+            dict: Result of adding to the queue
+        """
+        _SURVEY_QUEUE.put((survey_data.model_dump_json().encode(), notify_chat_id, notify_message_id))
+
+        return QueueResult(
+            status='queued',
+            chat_id=notify_chat_id
+        )
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Stop the worker and close the HTTP session.
+        Surveys that are still queued are not posted, the chats that requested them
+        get SURVEY_REJECTED_TEXT so the admin knows to send the command again.
+
+        Returns:
+            None
+        """
+        dropped: list[tuple[bytes, int, int | None]] = _SURVEY_QUEUE.stop()
+
+        if dropped:
+            logger.warning('Dropping %s queued surveys on shutdown', len(dropped))
+
+        for _, chat_id, message_id in dropped:
+            await MessageQueueService.send_message(
+                chat_id=chat_id,
+                text=SURVEY_REJECTED_TEXT,
+                parse_mode='Markdown',
+                message_id=message_id
+            )
+
+        if cls._http_session is not None and not cls._http_session.closed:
+            await cls._http_session.close()
+            logger.info('n8n HTTP session closed.')
+
+        cls._http_session = None
+
+    @classmethod
+    async def _deliver_surveys(cls, batch: list[tuple[bytes, int, int | None]]) -> None:
+        """
+        Deliver a batch of queued surveys concurrently.
+
+        Args:
+            batch (list[tuple[bytes, int, int | None]]): Queued surveys with their notification targets
+
+        Returns:
+            None
+        """
+        await asyncio.gather(*(cls._deliver_survey(*item) for item in batch))
+
+    @classmethod
+    async def _deliver_survey(cls, payload: bytes, chat_id: int, message_id: int | None) -> None:
+        """
+        Post one survey to n8n and report the result to the requesting chat.
+
+        Args:
+            payload (bytes): JSON-encoded survey for the webhook
+            chat_id (int): Chat ID for the delivery result
+            message_id (int | None): If provided, the result replies to this message ID
+
+        Returns:
+            None
+        """
+        try:
+            status, response_text = await cls._post(CREATE_SURVEY_WEBHOOK_PATH, payload)
+
+            if status == 200:
+                text: str = SURVEY_CREATED_TEXT
+
+            else:
+                logger.error(
+                    'Failed to create survey via n8n. Status: %s, Response: %s',
+                    status, response_text
+                )
+                text = SURVEY_REJECTED_TEXT
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error('Error connecting to n8n: %s', str(e))
+            text = CONNECTION_ERROR_TEXT
+
+        except Exception as e:
+            logger.error('Unexpected error while connecting to n8n: %s', str(e))
+            text = UNKNOWN_ERROR_TEXT
+
+        await MessageQueueService.send_message(
+            chat_id=chat_id,
+            text=text,
+            parse_mode='Markdown',
+            message_id=message_id
+        )
+
+    @classmethod
+    def _get_http_session(cls) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session for n8n webhook calls, creating it on first use.
+        The webhook secret header is set once on the session.
+
+        Returns:
+            aiohttp.ClientSession instance
+        """
+        if cls._http_session is None or cls._http_session.closed:
+            header: str | None = settings.n8n.n8n_webhook_header
+            cls._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60),
+                headers={header: settings.n8n.n8n_webhook_secret} if header else None
+            )
+
+        return cls._http_session
+
+    @classmethod
+    async def _post(cls, path: str, payload: bytes) -> tuple[int, str]:
+        """
+        Post a JSON-encoded payload to an n8n webhook.
+        The webhook creates a form on every accepted request, so only failures where
+        the request never reached n8n (connection errors and connect timeouts) are retried
+        with exponential backoff. Error responses and read timeouts are returned or raised
+        immediately, since n8n may have already processed the request.
+
+        Args:
+            path (str): Webhook path relative to the internal n8n URL
+            payload (bytes): JSON-encoded payload for the webhook
+
+        Returns:
+            Tuple of the response status and up to N8N_RESPONSE_BODY_LIMIT bytes of the response text
+
+        Raises:
+            aiohttp.ClientError: If the request fails with a client error
+            asyncio.TimeoutError: If the request times out
+        """
+        session: aiohttp.ClientSession = cls._get_http_session()
+
+        for attempt in range(N8N_MAX_ATTEMPTS):
+            try:
+                async with session.post(
+                        f'{settings.services.n8n_service}{path}',
+                        data=payload,
+                        headers=JSON_HEADERS,
+                        timeout=N8N_TIMEOUT
+                ) as response:
+                    body: bytes = await response.content.read(N8N_RESPONSE_BODY_LIMIT)
+                    return response.status, body.decode('utf-8', errors='replace')
+
+            except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError) as e:
+                if attempt == N8N_MAX_ATTEMPTS - 1:
+                    raise
+
+                logger.warning(
+                    'n8n is unreachable: %s (attempt %s/%s)',
+                    str(e), attempt + 1, N8N_MAX_ATTEMPTS
+                )
+
+            await asyncio.sleep(N8N_RETRY_BACKOFF * 2 ** attempt)
+
+
+# Surveys waiting to be posted to n8n
+_SURVEY_QUEUE: BatchQueue[tuple[bytes, int, int | None]] = BatchQueue(
+    flush=N8nQueueService._deliver_surveys,
+    interval=N8N_BATCH_INTERVAL,
+    max_size=N8N_BATCH_MAX_SIZE
+)
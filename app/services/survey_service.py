@@ -1,9 +1,15 @@
+import time
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from app.models import Survey
 from config import settings
 
+# Surveys are written to the database by n8n, so the cached list of active surveys
+# expires after ACTIVE_SURVEYS_CACHE_TTL seconds and is cleared when n8n reports a new form.
+ACTIVE_SURVEYS_CACHE_TTL: float = 30.0
+_ACTIVE_SURVEYS_CACHE: tuple[float, list[Survey]] | None = None
+
 
 class SurveyService:
     """
@@ -15,6 +21,8 @@ class SurveyService:
     Methods:
         get_survey_by_google_form_id: Retrieves a survey by its Google form ID.
         get_active_surveys: Retrieves all active (not finished) surveys.
+        get_cached_active_surveys: Retrieves all active surveys through the in-memory cache.
+        clear_active_surveys_cache: Clears the in-memory cache of active surveys.
     """
 
     def __init__(self):
@@ -43,6 +51,40 @@ class SurveyService:
             list[Survey]: List of active Survey objects
         """
         return await Survey.filter(ended_at__gt=datetime.now(tz=self.tz)).all()
+
+    async def get_cached_active_surveys(self) -> list[Survey]:
+        """
+        Gets all active surveys through the in-memory cache.
+        The list is cached for ACTIVE_SURVEYS_CACHE_TTL seconds, surveys that
+        have finished since then are filtered out on every call.
+
+        Returns:
+            list[Survey]: List of active Survey objects
+        """
+        global _ACTIVE_SURVEYS_CACHE
+
+        now: float = time.monotonic()
+        cached: tuple[float, list[Survey]] | None = _ACTIVE_SURVEYS_CACHE
+
+        if cached and cached[0] > now:
+            current_time: datetime = datetime.now(tz=self.tz)
+            return [survey for survey in cached[1] if survey.ended_at > current_time]
+
+        surveys: list[Survey] = await self.get_active_surveys()
+        _ACTIVE_SURVEYS_CACHE = (now + ACTIVE_SURVEYS_CACHE_TTL, surveys)
+
+        return surveys
+
+    @staticmethod
+    def clear_active_surveys_cache() -> None:
+        """
+        Clears the in-memory cache of active surveys.
+
+        Returns:
+            None
+        """
+        global _ACTIVE_SURVEYS_CACHE
+        _ACTIVE_SURVEYS_CACHE = None
     
     @staticmethod
     async def delete_all_surveys() -> int:
@@ -52,4 +94,9 @@ class SurveyService:
         Returns:
             int: Number of deleted survey records
         """
-        return await Survey.all().delete()
+        global _ACTIVE_SURVEYS_CACHE
+
+        deleted_count: int = await Survey.all().delete()
+        _ACTIVE_SURVEYS_CACHE = None
+
+        return deleted_count
@@ -1,5 +1,13 @@
+import time
+from typing import Any
+
 from app.models import SurveyTemplate
 
+# Templates are edited directly in the database, so cached entries
+# expire after TEMPLATE_CACHE_TTL seconds instead of being invalidated.
+TEMPLATE_CACHE_TTL: float = 60.0
+_TEMPLATE_CACHE: dict[str, tuple[float, SurveyTemplate]] = {}
+
 
 class SurveyTemplateService:
     """
@@ -8,6 +16,9 @@ class SurveyTemplateService:
     Methods:
         create_survey_template: Creates a new survey template.
         get_survey_template_by_name: Retrieves a survey template by its name.
+        get_cached_survey_template_by_name: Retrieves a survey template by its name through the in-memory cache.
+        clear_template_cache: Clears the in-memory template cache.
+        render_survey_template: Substitutes placeholders in the string values of template content.
     """
 
     @staticmethod
@@ -25,10 +36,13 @@ class SurveyTemplateService:
         Returns:
             SurveyTemplate: The created SurveyTemplate object
         """
-        return await SurveyTemplate.create(
+        template: SurveyTemplate = await SurveyTemplate.create(
             name=name,
             json_content=json_content
         )
+        _TEMPLATE_CACHE.pop(name, None)
+
+        return template
 
     @staticmethod
     async def get_survey_template_by_name(
@@ -44,3 +58,75 @@ class SurveyTemplateService:
             SurveyTemplate | None: SurveyTemplate object if found, else None
         """
         return await SurveyTemplate.filter(name=name).first()
+
+    @staticmethod
+    async def get_cached_survey_template_by_name(
+            name: str
+    ) -> SurveyTemplate | None:
+        """
+        Gets a survey template by its name through the in-memory cache.
+        Found templates are cached for TEMPLATE_CACHE_TTL seconds,
+        missing templates are not cached.
+
+        Args:
+            name (str): Name of the survey template
+
+        Returns:
+            SurveyTemplate | None: SurveyTemplate object if found, else None
+        """
+        now: float = time.monotonic()
+        cached: tuple[float, SurveyTemplate] | None = _TEMPLATE_CACHE.get(name)
+
+        if cached and cached[0] > now:
+            return cached[1]
+
+        template: SurveyTemplate | None = await SurveyTemplateService.get_survey_template_by_name(name)
+        if template:
+            _TEMPLATE_CACHE[name] = (now + TEMPLATE_CACHE_TTL, template)
+
+        return template
+
+    @staticmethod
+    def clear_template_cache() -> None:
+        """
+        Clears the in-memory template cache.
+
+        Returns:
+            None
+        """
+        _TEMPLATE_CACHE.clear()
+
+    @staticmethod
+    def render_survey_template(
+            json_content: Any,
+            values: dict[str, str]
+    ) -> tuple[Any, set[str]]:
+        """
+        Substitutes placeholders in the string values of template content.
+        The content is walked once and copied without a JSON round-trip,
+        so substituted values cannot break the structure of the template.
+
+        Args:
+            json_content (Any): JSON content of the survey template
+            values (dict[str, str]): Mapping of placeholders to their values
+
+        Returns:
+            tuple[Any, set[str]]: Content with substituted values and the set of placeholders found in it
+        """
+        found: set[str] = set()
+
+        def _render(node: Any) -> Any:
+            if isinstance(node, str):
+                if '{{' in node:
+                    for placeholder, value in values.items():
+                        if placeholder in node:
+                            found.add(placeholder)
+                            node = node.replace(placeholder, value)
+                return node
+            if isinstance(node, dict):
+                return {key: _render(item) for key, item in node.items()}
+            if isinstance(node, list):
+                return [_render(item) for item in node]
+            return node
+
+        return _render(json_content), found
@@ -1,8 +1,15 @@
 from datetime import datetime
 
+from tortoise.expressions import Case, When
+
 from app.models import User, UserRole
 from config.settings import settings
 
+# In-memory copy of privileged Telegram IDs, so that authorization checks
+# do not need a database round-trip. Rebuilt by UserService.refresh_role_cache().
+_CREATOR_IDS: frozenset[int] = frozenset()
+_ADMIN_IDS: frozenset[int] = frozenset()
+
 
 class UserService:
     """
@@ -15,10 +22,16 @@ class UserService:
         create_user: Creates a new user.
         update_user: Updates user information.
         set_user_role: Sets the user's role.
+        change_user_role: Changes the user's role if it matches the expected one.
         activate_user: Activates a user.
         deactivate_user: Deactivates a user.
+        deactivate_and_reset_role: Deactivates a user and resets their role with a single UPDATE.
+        toggle_reserved: Toggles the user's reservation status.
         get_users_by_role: Get a list of active users by their role.
         get_users_without_reservation_exclude_creators: Get a list of active users without reservations (creators are excluded).
+        refresh_role_cache: Reloads the in-memory sets of creator and admin Telegram IDs.
+        has_creator_role: Checks the in-memory cache for the creator role.
+        has_admin_role: Checks the in-memory cache for the admin or creator role.
     """
 
     @staticmethod
@@ -93,6 +106,9 @@ class UserService:
             username=username
         )
 
+        if role != UserRole.USER:
+            await UserService.refresh_role_cache()
+
         return user
 
     @staticmethod
@@ -111,6 +127,10 @@ class UserService:
         for key, value in data.items():
             setattr(user, key, value)
         await user.save()
+
+        if 'role' in data:
+            await UserService.refresh_role_cache()
+
         return user
 
     async def set_user_role(
@@ -135,9 +155,40 @@ class UserService:
         user.role = new_role
         user.updated_at = datetime.now(tz=settings.timezone_zoneinfo)
         await user.save()
+        await self.refresh_role_cache()
 
         return True
 
+    @staticmethod
+    async def change_user_role(
+            callsign: str,
+            from_role: UserRole,
+            to_role: UserRole
+    ) -> UserRole | None:
+        """
+        Changes the user's role with a single conditional UPDATE,
+        only if the user currently has the expected role.
+        The current role is read back only when nothing was updated.
+
+        Args:
+            callsign (str): Callsign of the user.
+            from_role (UserRole): Role the user must have for the change.
+            to_role (UserRole): New role to assign to the user.
+
+        Returns:
+            UserRole | None: Role of the user before the call (equal to from_role if the role
+            was changed) or None if the user was not found.
+        """
+        updated_count: int = await User.filter(callsign=callsign, role=from_role).update(
+            role=to_role,
+            updated_at=datetime.now(tz=settings.timezone_zoneinfo)
+        )
+        if updated_count:
+            await UserService.refresh_role_cache()
+            return from_role
+
+        return await User.filter(callsign=callsign).first().values_list('role', flat=True)
+
     @staticmethod
     async def activate_user(telegram_id: int) -> bool:
         """
@@ -180,6 +231,48 @@ class UserService:
 
         return True
 
+    @staticmethod
+    async def deactivate_and_reset_role(telegram_id: int) -> bool:
+        """
+        Deactivates a user and resets their role to USER with a single UPDATE.
+        The role cache is refreshed only if the user had a privileged role.
+
+        Args:
+            telegram_id (int): Telegram ID of the user.
+
+        Returns:
+            bool: True if the user was found, otherwise False.
+        """
+        updated_count: int = await User.filter(telegram_id=telegram_id).update(
+            active=False,
+            role=UserRole.USER,
+            updated_at=datetime.now(tz=settings.timezone_zoneinfo)
+        )
+
+        if updated_count and UserService.has_admin_role(telegram_id):
+            await UserService.refresh_role_cache()
+
+        return bool(updated_count)
+
+    @staticmethod
+    async def toggle_reserved(callsign: str) -> bool | None:
+        """
+        Toggles the user's reservation status with a single atomic UPDATE.
+
+        Args:
+            callsign (str): Callsign of the user.
+
+        Returns:
+            bool | None: New reservation status or None if the user was not found.
+        """
+        updated_count: int = await User.filter(callsign=callsign).update(
+            reserved=Case(When(reserved=True, then=False), default=True)
+        )
+        if not updated_count:
+            return None
+
+        return await User.filter(callsign=callsign).first().values_list('reserved', flat=True)
+
     @staticmethod
     async def get_users_by_role(
             role: UserRole
@@ -214,4 +307,52 @@ class UserService:
         Returns:
             int: Number of deleted users.
         """
-        return await User.filter(role__not=UserRole.CREATOR).delete()
+        deleted_count: int = await User.filter(role__not=UserRole.CREATOR).delete()
+        await UserService.refresh_role_cache()
+        return deleted_count
+
+    @staticmethod
+    async def refresh_role_cache() -> None:
+        """
+        Reloads the in-memory sets of creator and admin Telegram IDs from the database.
+        Must be called on startup and after every operation that changes user roles.
+
+        Returns:
+            None
+        """
+        global _CREATOR_IDS, _ADMIN_IDS
+
+        rows: list[tuple[int, UserRole]] = await User.filter(
+            role__in=[UserRole.ADMIN, UserRole.CREATOR]
+        ).values_list('telegram_id', 'role')
+
+        _CREATOR_IDS = frozenset(
+            telegram_id for telegram_id, role in rows if role == UserRole.CREATOR
+        )
+        _ADMIN_IDS = frozenset(telegram_id for telegram_id, _ in rows)
+
+    @staticmethod
+    def has_creator_role(telegram_id: int) -> bool:
+        """
+        Checks if the user is the bot creator using the in-memory role cache.
+
+        Args:
+            telegram_id (int): Telegram ID of the user.
+
+        Returns:
+            bool: True if the user is the bot creator, otherwise False.
+        """
+        return telegram_id in _CREATOR_IDS
+
+    @staticmethod
+    def has_admin_role(telegram_id: int) -> bool:
+        """
+        Checks if the user is an administrator or the bot creator using the in-memory role cache.
+
+        Args:
+            telegram_id (int): Telegram ID of the user.
+
+        Returns:
+            bool: True if the user is an administrator or the bot creator, otherwise False.
+        """
+        return telegram_id in _ADMIN_IDS
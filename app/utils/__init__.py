@@ -1,15 +1,19 @@
 from .validators import (
     validate_callsign_format, 
     validate_datetime_format, 
-    ValidationResult
+    ValidationResult,
+    CALLSIGN_TOO_LONG_MESSAGE
 )
-from .mesages import send_callsign_validation_error
-from .markdown import escape_markdown
+from .mesages import send_callsign_validation_error, CALLSIGN_REQUIREMENTS_TEXT
+from .markdown import escape_markdown, markdown_code_entities
 
 __all__ = [
     'validate_callsign_format',
     'validate_datetime_format',
     'ValidationResult',
+    'CALLSIGN_TOO_LONG_MESSAGE',
     'escape_markdown',
-    'send_callsign_validation_error'
+    'markdown_code_entities',
+    'send_callsign_validation_error',
+    'CALLSIGN_REQUIREMENTS_TEXT'
 ]
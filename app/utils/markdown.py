@@ -1,3 +1,9 @@
+from aiogram.types import MessageEntity
+
+# Special characters of the legacy Markdown parse mode, escaped in a single pass
+MARKDOWN_ESCAPE_TABLE: dict[int, str] = str.maketrans({char: f'\\{char}' for char in '_*`['})
+
+
 def escape_markdown(text: str | None) -> str:
     """
     Escape special characters for Telegram Markdown format.
@@ -11,10 +17,35 @@ def escape_markdown(text: str | None) -> str:
     if not text:
         return 'Не указано'
 
-    special_chars = ['_', '*', '`', '[']
+    return text.translate(MARKDOWN_ESCAPE_TABLE)
+
+
+def markdown_code_entities(text: str) -> tuple[str, list[MessageEntity]]:
+    """
+    Convert Markdown text with `code` spans into plain text and code entities,
+    so the message can be sent without parse_mode. Only backticks are handled.
+    Offsets and lengths are measured in UTF-16 code units, as Telegram requires.
+
+    Args:
+        text: Markdown text with paired backticks
+
+    Raises:
+        ValueError: If the text contains an unpaired backtick
+
+    Returns:
+        Plain text and the list of code entities
+    """
+    parts: list[str] = text.split('`')
+    if len(parts) % 2 == 0:
+        raise ValueError('Unpaired backtick in Markdown text')
+
+    entities: list[MessageEntity] = []
+    offset: int = 0
 
-    escaped_text = text
-    for char in special_chars:
-        escaped_text = escaped_text.replace(char, f'\\{char}')
+    for index, part in enumerate(parts):
+        length: int = len(part.encode('utf-16-le')) // 2
+        if index % 2 and length:
+            entities.append(MessageEntity(type='code', offset=offset, length=length))
+        offset += length
 
-    return escaped_text
+    return ''.join(parts), entities
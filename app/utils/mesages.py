@@ -1,5 +1,20 @@
 from app.services import MessageQueueService
 from app.utils import ValidationResult
+from app.utils.markdown import markdown_code_entities
+
+CALLSIGN_REQUIREMENTS_TEXT: str = (
+    'Требования к позывному:\n'
+    '🔤 Только латинские буквы\n'
+    '📏 Длина от 1 до 20 символов\n'
+    '🚫 Без цифр, спец символов и пробелов\n'
+    '🆔 Позывной должен быть уникальным'
+)
+CALLSIGN_VALIDATION_ERROR_TEMPLATE: str = (
+    '❌ Неверный формат позывного.\n\n'
+    '{error_message}\n\n'
+    'Используйте: `{command} позывной`\n\n'
+    f'{CALLSIGN_REQUIREMENTS_TEXT}'
+)
 
 
 async def send_callsign_validation_error(
@@ -22,16 +37,16 @@ async def send_callsign_validation_error(
     Returns:
         None
     """
-    await message_queue_service.send_message(
+    text, entities = markdown_code_entities(
+        CALLSIGN_VALIDATION_ERROR_TEMPLATE.format(
+            error_message=validation_result.error_message,
+            command=command
+        )
+    )
+    await message_queue_service.enqueue_error(
         chat_id=chat_id,
-        text=f'❌ Неверный формат позывного.\n\n'
-             f'{validation_result.error_message}\n\n'
-             f'Используйте: `{command} позывной`\n\n'
-             f'Требования к позывному:\n'
-             f'🔤 Только латинские буквы\n'
-             f'📏 Длина от 1 до 20 символов\n'
-             f'🚫 Без цифр, спец символов и пробелов\n'
-             f'🆔 Позывной должен быть уникальным',
-        parse_mode='Markdown',
+        text=text,
+        entities=entities,
+        parse_mode=None,
         message_id=message_id
     )
@@ -5,8 +5,11 @@ from datetime import datetime, timedelta
 from app.services import UserService
 from config import settings
 
+DATETIME_PATTERN: re.Pattern[str] = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}')
+CALLSIGN_TOO_LONG_MESSAGE: str = 'Позывной не должен превышать 20 символов.'
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of validation.
@@ -42,10 +45,10 @@ async def validate_callsign_format(callsign: str) -> ValidationResult:
     if len(callsign) > 20:
         return ValidationResult(
             is_valid=False,
-            error_message="Позывной не должен превышать 20 символов."
+            error_message=CALLSIGN_TOO_LONG_MESSAGE
         )
 
-    if not re.match(r'^[a-zA-Z]+$', callsign):
+    if not (callsign.isascii() and callsign.isalpha()):
         return ValidationResult(
             is_valid=False,
             error_message="Позывной должен содержать только латинские буквы."
@@ -60,9 +63,11 @@ async def validate_callsign_format(callsign: str) -> ValidationResult:
     return ValidationResult(is_valid=True)
 
 
-async def validate_datetime_format(datetime_str: str) -> ValidationResult:
+def validate_datetime_format(datetime_str: str) -> ValidationResult:
     """
     Validates the format of a datetime string (YYYY-MM-DD HH:MM).
+    The check is CPU-only, so the function is synchronous. The string is
+    matched against DATETIME_PATTERN first and then parsed with datetime.fromisoformat.
 
     Args:
         datetime_str (str): The datetime string to validate.
@@ -76,28 +81,31 @@ async def validate_datetime_format(datetime_str: str) -> ValidationResult:
             error_message='Дата и время не могут быть пустыми.'
         )
 
-    if not re.match(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$', datetime_str):
+    if not DATETIME_PATTERN.fullmatch(datetime_str):
         return ValidationResult(
             is_valid=False,
             error_message='Используйте правильный шаблон даты\nYYYY-MM-DD HH:MM.'
         )
 
     try:
-        parsed_datetime: datetime = datetime.strptime(datetime_str, '%Y-%m-%d %H:%M')
-        parsed_datetime: datetime = parsed_datetime.replace(tzinfo=settings.timezone_zoneinfo)
+        parsed_datetime: datetime = datetime.fromisoformat(datetime_str).replace(
+            tzinfo=settings.timezone_zoneinfo
+        )
     except ValueError:
         return ValidationResult(
             is_valid=False,
             error_message='Неверная дата или время. Убедитесь, что дата существует.'
         )
 
-    if parsed_datetime < datetime.now(tz=settings.timezone_zoneinfo):
+    now: datetime = datetime.now(tz=settings.timezone_zoneinfo)
+
+    if parsed_datetime < now:
         return ValidationResult(
             is_valid=False,
             error_message='Дата и время не могут быть в прошлом.'
         )
 
-    max_future_date: datetime = datetime.now(tz=settings.timezone_zoneinfo) + timedelta(days=180)
+    max_future_date: datetime = now + timedelta(days=180)
     if parsed_datetime > max_future_date:
         return ValidationResult(
             is_valid=False,
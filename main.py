@@ -1,9 +1,9 @@
 import logging
 import traceback
-from asyncio import run
 import sys
 
 import uvicorn
+import uvloop
 
 from app.bot_telegram import (
     BotManager,
@@ -55,13 +55,14 @@ def run_webhook_mode() -> None:
 
 def run_polling_mode() -> None:
     """
-    Function to run the bot in polling mode.
+    Function to run the bot in polling mode on the uvloop event loop.
+    Webhook mode gets uvloop from Uvicorn, which picks it automatically when installed.
 
     Returns:
         None
     """
     try:
-        run(main())
+        uvloop.run(main())
     except Exception as e:
         logger.error('Error occurred while starting the bot: %s\n%s', str(e), traceback.format_exc())
         sys.exit(1)
@@ -0,0 +1,167 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from aiogram.types import Message
+
+from app.decorators import AuthDecorators as Auth
+from app.decorators.auth import (
+    NOT_CREATOR_TEXT,
+    NOT_ADMIN_TEXT,
+    PRIVATE_CHAT_TEXT,
+    CHAT_NOT_BOUND_TEXT,
+    NOT_REGISTERED_TEXT
+)
+from app.models import Chat, User
+from app.services import ChatService, UserService
+
+
+def _message(user_id: int, chat_id: int = -1001234567890, chat_type: str = 'supergroup') -> Message:
+    """
+    Build an incoming command message.
+    """
+    return Message.model_validate({
+        'message_id': 5,
+        'date': 0,
+        'text': '/command',
+        'chat': {'id': chat_id, 'type': chat_type},
+        'from': {'id': user_id, 'is_bot': False, 'first_name': 'Test'}
+    })
+
+
+class _Handlers:
+    """
+    Handler class with commands guarded by Auth.require.
+    """
+
+    def __init__(self):
+        self.message_queue_service: Mock = Mock(send_message=AsyncMock())
+
+    @Auth.require(creator=True)
+    async def creator_command(self, message: Message) -> str:
+        return 'creator'
+
+    @Auth.require(admin=True)
+    async def admin_command(self, message: Message) -> str:
+        return 'admin'
+
+    @Auth.require(non_private=True)
+    async def group_command(self, message: Message) -> str:
+        return 'group'
+
+    @Auth.require(creator=True, chat_bound=True)
+    async def creator_chat_command(self, message: Message) -> str:
+        return 'creator_chat'
+
+    @Auth.require(chat_bound=True, registered=True)
+    async def registered_chat_command(self, message: Message) -> str:
+        return 'registered_chat'
+
+    @Auth.require(pass_user=True)
+    async def profile_command(self, message: Message, *, user: User) -> User:
+        return user
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAuthDecoratorsRequire:
+    """
+    Unit tests for AuthDecorators.require decorator.
+    """
+
+    async def test_require_creator(self, db: None, test_user_creator: User, test_user_admin: User):
+        """
+        Test that only the creator passes the creator check.
+        """
+        await UserService.refresh_role_cache()
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.creator_command(_message(test_user_creator.telegram_id)) == 'creator'
+        assert await handlers.creator_command(_message(test_user_admin.telegram_id)) is None
+
+        handlers.message_queue_service.send_message.assert_awaited_once_with(
+            chat_id=-1001234567890,
+            text=NOT_CREATOR_TEXT,
+            parse_mode='Markdown',
+            message_id=5
+        )
+
+    async def test_require_admin(
+            self,
+            db: None,
+            test_user_creator: User,
+            test_user_admin: User,
+            test_user_regular: User
+    ):
+        """
+        Test that admins and the creator pass the admin check and regular users do not.
+        """
+        await UserService.refresh_role_cache()
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.admin_command(_message(test_user_creator.telegram_id)) == 'admin'
+        assert await handlers.admin_command(_message(test_user_admin.telegram_id)) == 'admin'
+        assert await handlers.admin_command(_message(test_user_regular.telegram_id)) is None
+
+        assert handlers.message_queue_service.send_message.await_args.kwargs['text'] == NOT_ADMIN_TEXT
+
+    async def test_require_non_private(self):
+        """
+        Test that the non_private check rejects private chats without database queries.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.group_command(_message(1)) == 'group'
+        assert await handlers.group_command(_message(1, chat_id=1, chat_type='private')) is None
+
+        assert handlers.message_queue_service.send_message.await_args.kwargs['text'] == PRIVATE_CHAT_TEXT
+
+    async def test_require_chat_bound(self, db: None, test_user_creator: User, test_chat: Chat):
+        """
+        Test that the chat_bound check passes only in a bound chat.
+        """
+        await UserService.refresh_role_cache()
+        ChatService.clear_chat_cache()
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.creator_chat_command(_message(test_user_creator.telegram_id)) == 'creator_chat'
+        assert await handlers.creator_chat_command(_message(test_user_creator.telegram_id, chat_id=-100)) is None
+
+        assert handlers.message_queue_service.send_message.await_args.kwargs['text'] == CHAT_NOT_BOUND_TEXT
+
+    async def test_require_checks_in_order(self, db: None, test_user_regular: User):
+        """
+        Test that the first failed check is reported: creator is checked before chat_bound.
+        """
+        await UserService.refresh_role_cache()
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.creator_chat_command(_message(test_user_regular.telegram_id, chat_id=-100)) is None
+
+        handlers.message_queue_service.send_message.assert_awaited_once()
+        assert handlers.message_queue_service.send_message.await_args.kwargs['text'] == NOT_CREATOR_TEXT
+
+    async def test_require_registered(self, db: None, test_user_regular: User, test_chat: Chat):
+        """
+        Test that the registered check rejects users that are not in the database.
+        """
+        ChatService.clear_chat_cache()
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.registered_chat_command(_message(test_user_regular.telegram_id)) == 'registered_chat'
+        assert await handlers.registered_chat_command(_message(404)) is None
+
+        assert handlers.message_queue_service.send_message.await_args.kwargs['text'] == NOT_REGISTERED_TEXT
+
+    async def test_require_pass_user(self, db: None, test_user_regular: User):
+        """
+        Test that pass_user implies the registered check and passes the loaded user to the handler.
+        """
+        handlers: _Handlers = _Handlers()
+
+        user: User | None = await handlers.profile_command(_message(test_user_regular.telegram_id))
+
+        assert user is not None
+        assert user.id == test_user_regular.id
+
+        assert await handlers.profile_command(_message(404)) is None
+        assert handlers.message_queue_service.send_message.await_args.kwargs['text'] == NOT_REGISTERED_TEXT
@@ -0,0 +1,91 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.batch_queue import BatchQueue
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBatchQueue:
+    """
+    Unit tests for BatchQueue.
+    """
+
+    async def test_put_flushes_items_in_one_batch(self):
+        """
+        Test that items put within the interval are flushed as one batch.
+        """
+        flush: AsyncMock = AsyncMock()
+        queue: BatchQueue[int] = BatchQueue(flush=flush, interval=0.05, max_size=10)
+
+        for item in (1, 2, 3):
+            queue.put(item)
+
+        flush.assert_not_awaited()
+
+        await asyncio.sleep(0.2)
+
+        flush.assert_awaited_once_with([1, 2, 3])
+        assert len(queue) == 0
+
+    async def test_put_respects_max_size(self):
+        """
+        Test that a burst of items is split into batches of max_size.
+        """
+        flush: AsyncMock = AsyncMock()
+        queue: BatchQueue[int] = BatchQueue(flush=flush, interval=0.05, max_size=4)
+
+        for item in range(6):
+            queue.put(item)
+
+        await asyncio.sleep(0.2)
+
+        assert [call.args[0] for call in flush.await_args_list] == [[0, 1, 2, 3], [4, 5]]
+
+    async def test_put_keeps_pending_items_when_worker_restarts(self):
+        """
+        Test that items pending in a stopped worker are flushed by the restarted one.
+        """
+        flush: AsyncMock = AsyncMock()
+        queue: BatchQueue[int] = BatchQueue(flush=flush, interval=0.05, max_size=10)
+
+        queue.put(1)
+        queue._worker.cancel()
+        await asyncio.sleep(0)
+
+        queue.put(2)
+        await asyncio.sleep(0.2)
+
+        flush.assert_awaited_once_with([1, 2])
+
+    async def test_flush_error_does_not_stop_worker(self):
+        """
+        Test that a failed flush is logged and later batches are still flushed.
+        """
+        flush: AsyncMock = AsyncMock(side_effect=[Exception('Test error'), None])
+        queue: BatchQueue[int] = BatchQueue(flush=flush, interval=0.01, max_size=10)
+
+        queue.put(1)
+        await asyncio.sleep(0.1)
+        queue.put(2)
+        await asyncio.sleep(0.1)
+
+        assert [call.args[0] for call in flush.await_args_list] == [[1], [2]]
+
+    async def test_stop_returns_pending_items(self):
+        """
+        Test that stopping the queue cancels the worker and returns unflushed items.
+        """
+        flush: AsyncMock = AsyncMock()
+        queue: BatchQueue[int] = BatchQueue(flush=flush, interval=10, max_size=10)
+
+        queue.put(1)
+        queue.put(2)
+
+        assert queue.stop() == [1, 2]
+        assert len(queue) == 0
+
+        await asyncio.sleep(0.05)
+        flush.assert_not_awaited()
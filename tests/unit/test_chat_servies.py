@@ -333,6 +333,56 @@ class TestChatServiceThreadManagement:
         assert chat.thread_id == 22222
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestChatServiceCache:
+    """
+    Unit tests for the in-memory chat cache of ChatService.
+    """
+
+    async def test_get_cached_chat_reuses_cached_object(self, db: None, test_chat: Chat):
+        """
+        Test that a cached chat is returned without reading the database again.
+        """
+        service: ChatService = ChatService()
+        service.clear_chat_cache()
+
+        first: Chat | None = await service.get_cached_chat_by_telegram_id(test_chat.telegram_id)
+        await Chat.filter(telegram_id=test_chat.telegram_id).update(title='Renamed')
+        second: Chat | None = await service.get_cached_chat_by_telegram_id(test_chat.telegram_id)
+
+        assert first is not None
+        assert second is first
+        assert second.title == 'Test Chat'
+
+    async def test_get_cached_chat_evicted_on_thread_change(self, db: None, test_chat: Chat):
+        """
+        Test that changing the thread ID evicts the cached chat.
+        """
+        service: ChatService = ChatService()
+        service.clear_chat_cache()
+
+        await service.get_cached_chat_by_telegram_id(test_chat.telegram_id)
+        await service.set_thread_id(telegram_id=test_chat.telegram_id, thread_id=42)
+
+        chat: Chat | None = await service.get_cached_chat_by_telegram_id(test_chat.telegram_id)
+        assert chat is not None
+        assert chat.thread_id == 42
+
+    async def test_get_cached_chat_evicted_on_unbind(self, db: None, test_chat: Chat):
+        """
+        Test that unbinding the chat clears the cache.
+        """
+        service: ChatService = ChatService()
+        service.clear_chat_cache()
+
+        assert await service.get_cached_chat_by_telegram_id(test_chat.telegram_id) is not None
+
+        await service.unbind_chat()
+
+        assert await service.get_cached_chat_by_telegram_id(test_chat.telegram_id) is None
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestChatServiceEdgeCases:
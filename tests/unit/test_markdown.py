@@ -0,0 +1,80 @@
+import pytest
+from aiogram.types import MessageEntity
+
+from app.utils.markdown import escape_markdown, markdown_code_entities
+
+
+@pytest.mark.unit
+class TestEscapeMarkdown:
+    """
+    Unit tests for escape_markdown function.
+    """
+
+    def test_escape_markdown_special_characters(self):
+        """
+        Test that all Markdown special characters are escaped.
+        """
+        assert escape_markdown('a_b*c`d[e]') == 'a\\_b\\*c\\`d\\[e]'
+
+    @pytest.mark.parametrize('text', [None, ''])
+    def test_escape_markdown_empty_text(self, text: str | None):
+        """
+        Test that empty text is replaced with the placeholder.
+        """
+        assert escape_markdown(text) == 'Не указано'
+
+
+@pytest.mark.unit
+class TestMarkdownCodeEntities:
+    """
+    Unit tests for markdown_code_entities function.
+    """
+
+    def test_markdown_code_entities_without_code(self):
+        """
+        Test that text without backticks is returned unchanged without entities.
+        """
+        text, entities = markdown_code_entities('Просто текст')
+
+        assert text == 'Просто текст'
+        assert entities == []
+
+    def test_markdown_code_entities_with_code_spans(self):
+        """
+        Test that code spans are replaced with code entities.
+        """
+        text, entities = markdown_code_entities('Используйте: `/reg позывной` или `/help`')
+
+        assert text == 'Используйте: /reg позывной или /help'
+        assert entities == [
+            MessageEntity(type='code', offset=13, length=13),
+            MessageEntity(type='code', offset=31, length=5)
+        ]
+
+    def test_markdown_code_entities_counts_utf16_units(self):
+        """
+        Test that characters outside the BMP take two UTF-16 code units in offsets and lengths.
+        """
+        text, entities = markdown_code_entities('❌🚀 `a🚀b` `c`')
+
+        assert text == '❌🚀 a🚀b c'
+        assert entities == [
+            MessageEntity(type='code', offset=4, length=4),
+            MessageEntity(type='code', offset=9, length=1)
+        ]
+
+    def test_markdown_code_entities_skips_empty_span(self):
+        """
+        Test that an empty code span does not produce an entity.
+        """
+        text, entities = markdown_code_entities('a `` b')
+
+        assert text == 'a  b'
+        assert entities == []
+
+    def test_markdown_code_entities_unpaired_backtick(self):
+        """
+        Test that an unpaired backtick raises ValueError.
+        """
+        with pytest.raises(ValueError):
+            markdown_code_entities('`/reg позывной')
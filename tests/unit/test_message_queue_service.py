@@ -1,11 +1,12 @@
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
-from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, MessageEntity
 from celery.result import AsyncResult
 
 from app.schemas import QueueResult, TaskStatus
-from app.services.message_queue_service import MessageQueueService
+from app.services.message_queue_service import MessageQueueService, _COALESCE_QUEUE
 
 
 @pytest.mark.unit
@@ -344,6 +345,237 @@ class TestMessageQueueServiceSendBulkMessages:
         assert result.message_count == 1
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMessageQueueServiceSendMany:
+    """
+    Unit tests for MessageQueueService.send_many method.
+    """
+
+    @patch('app.services.message_queue_service.celery_send_telegram_message_batch')
+    async def test_send_many_success(
+            self,
+            mock_celery_task: Mock,
+            mock_celery_async_result: Mock
+    ):
+        """
+        Test that all messages are queued as a single batch task.
+        """
+        mock_celery_task.delay.return_value = mock_celery_async_result
+        service: MessageQueueService = MessageQueueService()
+
+        messages = [
+            {'chat_id': 111, 'text': 'Error 1', 'parse_mode': 'Markdown', 'message_id': 1},
+            {'chat_id': 222, 'text': 'Error 2', 'parse_mode': 'Markdown', 'message_id': 2}
+        ]
+
+        result: QueueResult = await service.send_many(messages)
+
+        assert result.status == 'queued'
+        assert result.task_id == 'test-task-id-12345'
+        assert result.message_count == 2
+
+        mock_celery_task.delay.assert_called_once_with(messages)
+
+    @patch('app.services.message_queue_service.celery_send_telegram_message_batch')
+    async def test_send_many_error_handling(
+            self,
+            mock_celery_task: Mock
+    ):
+        """
+        Test error handling in send_many.
+        """
+        mock_celery_task.delay.side_effect = Exception('Batch send failed')
+        service: MessageQueueService = MessageQueueService()
+
+        result: QueueResult = await service.send_many([{'chat_id': 111, 'text': 'Error'}])
+
+        assert result.status == 'error'
+        assert 'Batch send failed' in result.message
+        assert result.task_id is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMessageQueueServiceEnqueueError:
+    """
+    Unit tests for MessageQueueService.enqueue_error method.
+    """
+
+    @patch('app.services.message_queue_service.celery_send_telegram_message_batch')
+    async def test_enqueue_error_batches_replies(
+            self,
+            mock_celery_task: Mock,
+            mock_celery_async_result: Mock
+    ):
+        """
+        Test that error replies enqueued together are queued as one batch.
+        """
+        mock_celery_task.delay.return_value = mock_celery_async_result
+        service: MessageQueueService = MessageQueueService()
+
+        for chat_id in (111, 222, 333):
+            result: QueueResult = await service.enqueue_error(
+                chat_id=chat_id,
+                text='Error',
+                parse_mode='Markdown',
+                message_id=1
+            )
+            assert result.status == 'queued'
+            assert result.chat_id == chat_id
+
+        mock_celery_task.delay.assert_not_called()
+
+        await asyncio.sleep(0.2)
+
+        mock_celery_task.delay.assert_called_once()
+        batch: list[dict] = mock_celery_task.delay.call_args.args[0]
+        assert [message['chat_id'] for message in batch] == [111, 222, 333]
+        assert batch[0] == {
+            'chat_id': 111,
+            'text': 'Error',
+            'parse_mode': 'Markdown',
+            'message_id': 1,
+            'entities': None
+        }
+
+    @patch('app.services.message_queue_service.celery_send_telegram_message_batch')
+    async def test_enqueue_error_with_entities(
+            self,
+            mock_celery_task: Mock,
+            mock_celery_async_result: Mock
+    ):
+        """
+        Test that message entities are queued as dictionaries.
+        """
+        mock_celery_task.delay.return_value = mock_celery_async_result
+        service: MessageQueueService = MessageQueueService()
+
+        await service.enqueue_error(
+            chat_id=111,
+            text='Use /reg callsign',
+            parse_mode=None,
+            entities=[MessageEntity(type='code', offset=4, length=13)]
+        )
+
+        await asyncio.sleep(0.2)
+
+        batch: list[dict] = mock_celery_task.delay.call_args.args[0]
+        assert batch[0]['parse_mode'] is None
+        assert batch[0]['entities'] == [{'type': 'code', 'offset': 4, 'length': 13}]
+
+    @patch('app.services.message_queue_service.celery_send_telegram_message_batch')
+    async def test_enqueue_error_respects_batch_size(
+            self,
+            mock_celery_task: Mock,
+            mock_celery_async_result: Mock
+    ):
+        """
+        Test that a burst of error replies is split into batches of ERROR_BATCH_MAX_SIZE.
+        """
+        mock_celery_task.delay.return_value = mock_celery_async_result
+        service: MessageQueueService = MessageQueueService()
+
+        for chat_id in range(12):
+            await service.enqueue_error(chat_id=chat_id, text='Error')
+
+        await asyncio.sleep(0.2)
+
+        assert mock_celery_task.delay.call_count == 2
+        assert len(mock_celery_task.delay.call_args_list[0].args[0]) == 10
+        assert len(mock_celery_task.delay.call_args_list[1].args[0]) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMessageQueueServiceScheduleMessage:
+    """
+    Unit tests for MessageQueueService.schedule_message method.
+    """
+
+    @patch.object(_COALESCE_QUEUE, 'interval', 0.05)
+    @patch('app.services.message_queue_service.celery_send_telegram_message_batch')
+    async def test_schedule_message_joins_messages_per_chat(
+            self,
+            mock_celery_task: Mock,
+            mock_celery_async_result: Mock
+    ):
+        """
+        Test that messages scheduled together are joined into one message per chat.
+        """
+        mock_celery_task.delay.return_value = mock_celery_async_result
+        service: MessageQueueService = MessageQueueService()
+
+        for chat_id, text in ((111, 'First'), (222, 'Other'), (111, 'Second')):
+            result: QueueResult = await service.schedule_message(chat_id=chat_id, text=text, parse_mode='Markdown')
+            assert result.status == 'queued'
+
+        mock_celery_task.delay.assert_not_called()
+
+        await asyncio.sleep(0.2)
+
+        mock_celery_task.delay.assert_called_once_with([
+            {'chat_id': 111, 'text': 'First\nSecond', 'parse_mode': 'Markdown'},
+            {'chat_id': 222, 'text': 'Other', 'parse_mode': 'Markdown'}
+        ])
+
+    @patch.object(_COALESCE_QUEUE, 'interval', 0.05)
+    @patch('app.services.message_queue_service.celery_send_telegram_message_batch')
+    async def test_schedule_message_respects_max_lines(
+            self,
+            mock_celery_task: Mock,
+            mock_celery_async_result: Mock
+    ):
+        """
+        Test that a burst of messages is split into messages of COALESCE_MAX_LINES lines.
+        """
+        mock_celery_task.delay.return_value = mock_celery_async_result
+        service: MessageQueueService = MessageQueueService()
+
+        for number in range(25):
+            await service.schedule_message(chat_id=111, text=f'Line {number}')
+
+        await asyncio.sleep(0.2)
+
+        assert mock_celery_task.delay.call_count == 2
+        assert mock_celery_task.delay.call_args_list[0].args[0][0]['text'].count('\n') == 19
+        assert mock_celery_task.delay.call_args_list[1].args[0][0]['text'].count('\n') == 4
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMessageQueueServiceClose:
+    """
+    Unit tests for MessageQueueService.close method.
+    """
+
+    @patch('app.services.message_queue_service.celery_send_telegram_message_batch')
+    async def test_close_queues_pending_messages(
+            self,
+            mock_celery_task: Mock,
+            mock_celery_async_result: Mock
+    ):
+        """
+        Test that pending error replies and scheduled messages are queued on close instead of being dropped.
+        """
+        mock_celery_task.delay.return_value = mock_celery_async_result
+        service: MessageQueueService = MessageQueueService()
+
+        await service.enqueue_error(chat_id=111, text='Error')
+        await service.schedule_message(chat_id=222, text='First', parse_mode='Markdown')
+        await service.schedule_message(chat_id=222, text='Second', parse_mode='Markdown')
+
+        await service.close()
+
+        assert [call.args[0] for call in mock_celery_task.delay.call_args_list] == [
+            [{'chat_id': 111, 'text': 'Error', 'parse_mode': 'HTML', 'message_id': None, 'entities': None}],
+            [{'chat_id': 222, 'text': 'First\nSecond', 'parse_mode': 'Markdown'}]
+        ]
+
+        await asyncio.sleep(0.2)
+        assert mock_celery_task.delay.call_count == 2
+
+
 @pytest.mark.unit
 class TestMessageQueueServiceEdgeCases:
     """
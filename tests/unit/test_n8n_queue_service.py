@@ -0,0 +1,210 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import aiohttp
+import pytest
+
+from app.schemas import QueueResult, SurveyData
+from app.services.n8n_queue_service import (
+    N8nQueueService,
+    SURVEY_CREATED_TEXT,
+    SURVEY_REJECTED_TEXT,
+    CONNECTION_ERROR_TEXT,
+    N8N_RESPONSE_BODY_LIMIT
+)
+
+SURVEY_DATA: SurveyData = SurveyData(info={'title': 'Test survey', 'documentTitle': '2099-01-01 10:00:00'})
+
+
+def _response(status: int, text: str = '') -> MagicMock:
+    """
+    Build a mock of the aiohttp.ClientSession.post context manager.
+    """
+    response: Mock = Mock(status=status)
+    response.content.read = AsyncMock(return_value=text.encode())
+
+    context: MagicMock = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return context
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestN8nQueueServiceEnqueue:
+    """
+    Unit tests for N8nQueueService.enqueue method.
+    """
+
+    @pytest.mark.parametrize(
+        'post_result, expected_text',
+        [
+            ((200, 'ok'), SURVEY_CREATED_TEXT),
+            ((400, 'bad request'), SURVEY_REJECTED_TEXT),
+            (aiohttp.ClientConnectionError('refused'), CONNECTION_ERROR_TEXT)
+        ]
+    )
+    @patch('app.services.n8n_queue_service.MessageQueueService.send_message', new_callable=AsyncMock)
+    async def test_enqueue_delivers_survey_and_notifies_chat(
+            self,
+            mock_send_message: AsyncMock,
+            post_result: tuple[int, str] | Exception,
+            expected_text: str
+    ):
+        """
+        Test that a queued survey is posted in the background and the result is sent to the chat.
+        """
+        with patch.object(N8nQueueService, '_post', new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = [post_result]
+
+            result: QueueResult = await N8nQueueService.enqueue(
+                SURVEY_DATA,
+                notify_chat_id=111,
+                notify_message_id=5
+            )
+
+            assert result.status == 'queued'
+            assert result.chat_id == 111
+
+            await asyncio.sleep(0.2)
+            await N8nQueueService.close()
+
+        mock_post.assert_awaited_once_with('/webhook/create-google-form', SURVEY_DATA.model_dump_json().encode())
+        mock_send_message.assert_awaited_once_with(
+            chat_id=111,
+            text=expected_text,
+            parse_mode='Markdown',
+            message_id=5
+        )
+
+    @patch('app.services.n8n_queue_service.MessageQueueService.send_message', new_callable=AsyncMock)
+    async def test_enqueue_posts_batch_concurrently(self, mock_send_message: AsyncMock):
+        """
+        Test that surveys queued together are posted concurrently.
+        """
+        in_flight: list[int] = [0, 0]
+
+        async def post(path: str, payload: bytes) -> tuple[int, str]:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return 200, 'ok'
+
+        with patch.object(N8nQueueService, '_post', side_effect=post):
+            for chat_id in (111, 222, 333):
+                await N8nQueueService.enqueue(SURVEY_DATA, notify_chat_id=chat_id)
+
+            await asyncio.sleep(0.2)
+            await N8nQueueService.close()
+
+        assert in_flight[1] == 3
+        assert sorted(call.kwargs['chat_id'] for call in mock_send_message.await_args_list) == [111, 222, 333]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestN8nQueueServiceClose:
+    """
+    Unit tests for N8nQueueService.close method.
+    """
+
+    @patch('app.services.n8n_queue_service.MessageQueueService.send_message', new_callable=AsyncMock)
+    async def test_close_rejects_queued_surveys(self, mock_send_message: AsyncMock):
+        """
+        Test that surveys still queued on shutdown are not posted and their chats are notified.
+        """
+        with patch.object(N8nQueueService, '_post', new_callable=AsyncMock) as mock_post:
+            await N8nQueueService.enqueue(SURVEY_DATA, notify_chat_id=111, notify_message_id=5)
+            await N8nQueueService.enqueue(SURVEY_DATA, notify_chat_id=222)
+
+            await N8nQueueService.close()
+            await asyncio.sleep(0.2)
+
+        mock_post.assert_not_awaited()
+        assert [call.kwargs for call in mock_send_message.await_args_list] == [
+            {'chat_id': 111, 'text': SURVEY_REJECTED_TEXT, 'parse_mode': 'Markdown', 'message_id': 5},
+            {'chat_id': 222, 'text': SURVEY_REJECTED_TEXT, 'parse_mode': 'Markdown', 'message_id': None}
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestN8nQueueServicePost:
+    """
+    Unit tests for N8nQueueService._post method.
+    """
+
+    @patch('app.services.n8n_queue_service.asyncio.sleep', new_callable=AsyncMock)
+    async def test_post_retries_connection_errors(self, mock_sleep: AsyncMock):
+        """
+        Test that requests that never reached n8n are retried with backoff.
+        """
+        session: Mock = Mock()
+        session.post.side_effect = [aiohttp.ConnectionTimeoutError(), _response(200, 'ok')]
+
+        with patch.object(N8nQueueService, '_get_http_session', return_value=session):
+            result: tuple[int, str] = await N8nQueueService._post('/webhook/test', b'{}')
+
+        assert result == (200, 'ok')
+        assert session.post.call_count == 2
+        mock_sleep.assert_awaited_once_with(0.5)
+
+    @pytest.mark.parametrize('status, text', [(400, 'bad request'), (503, 'unavailable')])
+    @patch('app.services.n8n_queue_service.asyncio.sleep', new_callable=AsyncMock)
+    async def test_post_does_not_retry_error_responses(self, mock_sleep: AsyncMock, status: int, text: str):
+        """
+        Test that error responses are returned without retries, since n8n may have processed the request.
+        """
+        session: Mock = Mock()
+        session.post.side_effect = [_response(status, text)]
+
+        with patch.object(N8nQueueService, '_get_http_session', return_value=session):
+            result: tuple[int, str] = await N8nQueueService._post('/webhook/test', b'{}')
+
+        assert result == (status, text)
+        mock_sleep.assert_not_awaited()
+
+    @patch('app.services.n8n_queue_service.asyncio.sleep', new_callable=AsyncMock)
+    async def test_post_does_not_retry_read_timeout(self, mock_sleep: AsyncMock):
+        """
+        Test that a timeout after the request was sent is raised without retries.
+        """
+        session: Mock = Mock()
+        session.post.side_effect = asyncio.TimeoutError
+
+        with patch.object(N8nQueueService, '_get_http_session', return_value=session):
+            with pytest.raises(asyncio.TimeoutError):
+                await N8nQueueService._post('/webhook/test', b'{}')
+
+        assert session.post.call_count == 1
+        mock_sleep.assert_not_awaited()
+
+    async def test_post_limits_response_body(self):
+        """
+        Test that only the beginning of the response body is read.
+        """
+        context: MagicMock = _response(500, 'error')
+        session: Mock = Mock()
+        session.post.side_effect = [context]
+
+        with patch.object(N8nQueueService, '_get_http_session', return_value=session):
+            await N8nQueueService._post('/webhook/test', b'{}')
+
+        response: Mock = await context.__aenter__()
+        response.content.read.assert_awaited_once_with(N8N_RESPONSE_BODY_LIMIT)
+
+    @patch('app.services.n8n_queue_service.asyncio.sleep', new_callable=AsyncMock)
+    async def test_post_raises_after_last_connection_error(self, mock_sleep: AsyncMock):
+        """
+        Test that a connection failure on the last attempt is raised.
+        """
+        session: Mock = Mock()
+        session.post.side_effect = aiohttp.ConnectionTimeoutError
+
+        with patch.object(N8nQueueService, '_get_http_session', return_value=session):
+            with pytest.raises(aiohttp.ConnectionTimeoutError):
+                await N8nQueueService._post('/webhook/test', b'{}')
+
+        assert session.post.call_count == 3
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [0.5, 1.0]
@@ -277,6 +277,66 @@ class TestSurveyServiceGetActiveSurveys:
         assert any(s.id == survey.id for s in active_surveys)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSurveyServiceActiveSurveysCache:
+    """
+    Unit tests for the in-memory cache of active surveys in SurveyService.
+    """
+
+    async def test_get_cached_active_surveys_reuses_cached_list(self, db: None, test_survey: Survey):
+        """
+        Test that cached active surveys are returned without reading the database again.
+        """
+        service: SurveyService = SurveyService()
+        service.clear_active_surveys_cache()
+
+        first: list[Survey] = await service.get_cached_active_surveys()
+        await Survey.create(
+            google_form_id='form_after_cache',
+            title='Survey after cache',
+            form_url='https://forms.google.com/form_after_cache',
+            ended_at=datetime.now(ZoneInfo('Europe/Moscow')) + timedelta(days=1),
+            expired=False
+        )
+        second: list[Survey] = await service.get_cached_active_surveys()
+
+        assert [s.id for s in second] == [s.id for s in first]
+
+        service.clear_active_surveys_cache()
+        third: list[Survey] = await service.get_cached_active_surveys()
+
+        assert len(third) == len(first) + 1
+
+    async def test_get_cached_active_surveys_filters_finished(self, db: None, test_survey: Survey):
+        """
+        Test that surveys finished after caching are not returned.
+        """
+        service: SurveyService = SurveyService()
+        service.clear_active_surveys_cache()
+
+        surveys: list[Survey] = await service.get_cached_active_surveys()
+        assert any(s.id == test_survey.id for s in surveys)
+
+        for survey in surveys:
+            survey.ended_at = datetime.now(tz=service.tz) - timedelta(minutes=1)
+
+        assert await service.get_cached_active_surveys() == []
+
+    async def test_delete_all_surveys_clears_cache(self, db: None, test_survey: Survey):
+        """
+        Test that deleting all surveys clears the cache of active surveys.
+        """
+        service: SurveyService = SurveyService()
+        service.clear_active_surveys_cache()
+
+        assert await service.get_cached_active_surveys()
+
+        await service.delete_all_surveys()
+
+        assert await service.get_cached_active_surveys() == []
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestSurveyServiceInitialization:
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from app.models import SurveyTemplate
@@ -154,6 +156,123 @@ class TestSurveyTemplateServiceGet:
         assert template.json_content == {'id': 2}
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSurveyTemplateServiceCache:
+    """
+    Unit tests for the in-memory template cache of SurveyTemplateService.
+    """
+
+    async def test_get_cached_survey_template_reuses_cached_object(self, db: None):
+        """
+        Test that a cached template is returned without reading the database again.
+        """
+        service: SurveyTemplateService = SurveyTemplateService()
+        service.clear_template_cache()
+
+        await service.create_survey_template('cached', {'version': 1})
+
+        first: SurveyTemplate | None = await service.get_cached_survey_template_by_name('cached')
+        await SurveyTemplate.filter(name='cached').update(json_content={'version': 2})
+        second: SurveyTemplate | None = await service.get_cached_survey_template_by_name('cached')
+
+        assert first is not None
+        assert second is first
+        assert second.json_content == {'version': 1}
+
+    async def test_get_cached_survey_template_expires(self, db: None):
+        """
+        Test that an expired cache entry is reloaded from the database.
+        """
+        service: SurveyTemplateService = SurveyTemplateService()
+        service.clear_template_cache()
+
+        await service.create_survey_template('expiring', {'version': 1})
+        await service.get_cached_survey_template_by_name('expiring')
+        await SurveyTemplate.filter(name='expiring').update(json_content={'version': 2})
+
+        with patch('app.services.survey_template_service.TEMPLATE_CACHE_TTL', 0):
+            service.clear_template_cache()
+            await service.get_cached_survey_template_by_name('expiring')
+            template: SurveyTemplate | None = await service.get_cached_survey_template_by_name('expiring')
+
+        assert template is not None
+        assert template.json_content == {'version': 2}
+
+    async def test_get_cached_survey_template_missing_is_not_cached(self, db: None):
+        """
+        Test that a missing template is not cached and is found once it is created.
+        """
+        service: SurveyTemplateService = SurveyTemplateService()
+        service.clear_template_cache()
+
+        assert await service.get_cached_survey_template_by_name('late') is None
+
+        await SurveyTemplate.create(name='late', json_content={'late': True})
+
+        template: SurveyTemplate | None = await service.get_cached_survey_template_by_name('late')
+        assert template is not None
+        assert template.json_content == {'late': True}
+
+
+@pytest.mark.unit
+class TestSurveyTemplateServiceRender:
+    """
+    Unit tests for SurveyTemplateService.render_survey_template method.
+    """
+
+    def test_render_survey_template_substitutes_values(self):
+        """
+        Test that placeholders are substituted in nested string values.
+        """
+        json_content: dict = {
+            'info': {
+                'title': '{{title}}',
+                'documentTitle': '{{title}} до {{ended_at}}'
+            },
+            'items': [{'question': 'Будешь?', 'required': True}]
+        }
+
+        rendered, found = SurveyTemplateService.render_survey_template(
+            json_content,
+            {'{{title}}': 'Опрос', '{{ended_at}}': '2025-01-01 23:59:00'}
+        )
+
+        assert rendered == {
+            'info': {
+                'title': 'Опрос',
+                'documentTitle': 'Опрос до 2025-01-01 23:59:00'
+            },
+            'items': [{'question': 'Будешь?', 'required': True}]
+        }
+        assert found == {'{{title}}', '{{ended_at}}'}
+        assert json_content['info']['title'] == '{{title}}'
+
+    def test_render_survey_template_keeps_special_characters(self):
+        """
+        Test that quotes and backslashes in values do not break the template structure.
+        """
+        rendered, found = SurveyTemplateService.render_survey_template(
+            {'info': {'title': '{{title}}'}},
+            {'{{title}}': 'Месим "говно" \\ 24 часа'}
+        )
+
+        assert rendered == {'info': {'title': 'Месим "говно" \\ 24 часа'}}
+        assert found == {'{{title}}'}
+
+    def test_render_survey_template_reports_missing_placeholders(self):
+        """
+        Test that only the placeholders present in the template are reported.
+        """
+        rendered, found = SurveyTemplateService.render_survey_template(
+            {'info': {'title': '{{title}}', 'documentTitle': 'static'}},
+            {'{{title}}': 'Опрос', '{{ended_at}}': '2025-01-01 23:59:00'}
+        )
+
+        assert rendered == {'info': {'title': 'Опрос', 'documentTitle': 'static'}}
+        assert found == {'{{title}}'}
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestSurveyTemplateServiceEdgeCases:
@@ -296,6 +296,123 @@ class TestUserServiceRoleManagement:
         assert updated_user is not None
         assert updated_user.updated_at > old_updated_at
 
+    async def test_change_user_role_success(self, db: None, test_user_regular: User):
+        """
+        Test changing a user's role when it matches the expected role.
+        """
+        service: UserService = UserService()
+
+        previous_role: UserRole | None = await service.change_user_role(
+            callsign=test_user_regular.callsign,
+            from_role=UserRole.USER,
+            to_role=UserRole.ADMIN
+        )
+
+        assert previous_role == UserRole.USER
+
+        await test_user_regular.refresh_from_db()
+        assert test_user_regular.role == UserRole.ADMIN
+        assert service.has_admin_role(test_user_regular.telegram_id) is True
+
+    async def test_change_user_role_role_mismatch(self, db: None, test_user_creator: User):
+        """
+        Test that the role is not changed when the user has a different role.
+        """
+        service: UserService = UserService()
+
+        previous_role: UserRole | None = await service.change_user_role(
+            callsign=test_user_creator.callsign,
+            from_role=UserRole.USER,
+            to_role=UserRole.ADMIN
+        )
+
+        assert previous_role == UserRole.CREATOR
+
+        await test_user_creator.refresh_from_db()
+        assert test_user_creator.role == UserRole.CREATOR
+
+    async def test_change_user_role_user_not_found(self, db: None):
+        """
+        Test changing the role of a non-existent user.
+        """
+        service: UserService = UserService()
+
+        previous_role: UserRole | None = await service.change_user_role(
+            callsign='nonexistent',
+            from_role=UserRole.USER,
+            to_role=UserRole.ADMIN
+        )
+
+        assert previous_role is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUserServiceRoleCache:
+    """
+    Unit tests for the in-memory role cache of UserService.
+    """
+
+    async def test_refresh_role_cache(
+            self, db: None, test_user_creator: User, test_user_admin: User, test_user_regular: User
+    ):
+        """
+        Test that refreshing the cache loads creators and admins from the database.
+        """
+        service: UserService = UserService()
+
+        await service.refresh_role_cache()
+
+        assert service.has_creator_role(test_user_creator.telegram_id) is True
+        assert service.has_admin_role(test_user_creator.telegram_id) is True
+        assert service.has_creator_role(test_user_admin.telegram_id) is False
+        assert service.has_admin_role(test_user_admin.telegram_id) is True
+        assert service.has_creator_role(test_user_regular.telegram_id) is False
+        assert service.has_admin_role(test_user_regular.telegram_id) is False
+
+    async def test_set_user_role_refreshes_cache(self, db: None, test_user_regular: User):
+        """
+        Test that changing a user's role updates the cache.
+        """
+        service: UserService = UserService()
+        await service.refresh_role_cache()
+
+        await service.set_user_role(telegram_id=test_user_regular.telegram_id, new_role=UserRole.ADMIN)
+        assert service.has_admin_role(test_user_regular.telegram_id) is True
+
+        await service.set_user_role(telegram_id=test_user_regular.telegram_id, new_role=UserRole.USER)
+        assert service.has_admin_role(test_user_regular.telegram_id) is False
+
+    async def test_create_user_with_creator_role_refreshes_cache(self, db: None):
+        """
+        Test that creating a creator updates the cache.
+        """
+        service: UserService = UserService()
+        await service.refresh_role_cache()
+
+        creator: User = await service.create_user(
+            telegram_id=555666777,
+            callsign='newcreator',
+            role=UserRole.CREATOR
+        )
+
+        assert service.has_creator_role(creator.telegram_id) is True
+        assert service.has_admin_role(creator.telegram_id) is True
+
+    async def test_delete_all_users_exclude_creators_refreshes_cache(
+            self, db: None, test_user_creator: User, test_user_admin: User
+    ):
+        """
+        Test that deleting users removes admins from the cache and keeps creators.
+        """
+        service: UserService = UserService()
+        await service.refresh_role_cache()
+
+        await service.delete_all_users_exclude_creators()
+
+        assert service.has_admin_role(test_user_admin.telegram_id) is False
+        assert service.has_creator_role(test_user_creator.telegram_id) is True
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -304,6 +421,32 @@ class TestUserServiceActivationDeactivation:
     Unit tests for UserService activation and deactivation methods.
     """
 
+    async def test_deactivate_and_reset_role(self, db: None, test_user_admin: User):
+        """
+        Test that leaving users are deactivated and lose their admin role.
+        """
+        service: UserService = UserService()
+        await service.refresh_role_cache()
+
+        result: bool = await service.deactivate_and_reset_role(telegram_id=test_user_admin.telegram_id)
+
+        assert result is True
+
+        await test_user_admin.refresh_from_db()
+        assert test_user_admin.active is False
+        assert test_user_admin.role == UserRole.USER
+        assert service.has_admin_role(test_user_admin.telegram_id) is False
+
+    async def test_deactivate_and_reset_role_not_found(self, db: None):
+        """
+        Test deactivating and resetting the role of a non-existent user.
+        """
+        service: UserService = UserService()
+
+        result: bool = await service.deactivate_and_reset_role(telegram_id=999999999)
+
+        assert result is False
+
     async def test_activate_user_success(self, db: None):
         """
         Test activating a user successfully.
@@ -410,6 +553,42 @@ class TestUserServiceActivationDeactivation:
         assert user.active is True
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUserServiceReservation:
+    """
+    Unit tests for UserService.toggle_reserved method.
+    """
+
+    async def test_toggle_reserved(self, db: None, test_user_regular: User):
+        """
+        Test that toggling the reservation status flips it and returns the new value.
+        """
+        service: UserService = UserService()
+
+        reserved: bool | None = await service.toggle_reserved(callsign=test_user_regular.callsign)
+        assert reserved is True
+
+        await test_user_regular.refresh_from_db()
+        assert test_user_regular.reserved is True
+
+        reserved = await service.toggle_reserved(callsign=test_user_regular.callsign)
+        assert reserved is False
+
+        await test_user_regular.refresh_from_db()
+        assert test_user_regular.reserved is False
+
+    async def test_toggle_reserved_not_found(self, db: None):
+        """
+        Test toggling the reservation status of a non-existent user.
+        """
+        service: UserService = UserService()
+
+        reserved: bool | None = await service.toggle_reserved(callsign='nonexistent')
+
+        assert reserved is None
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestUserServiceFiltering:
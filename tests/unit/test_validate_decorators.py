@@ -0,0 +1,206 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from aiogram.types import Message
+
+from config import settings
+from app.decorators import CallsignDecorators, SurveyCreationDecorators
+from app.decorators.validate import (
+    REG_NO_CALLSIGN_TEXT,
+    SURVEY_NO_PARAMS_TEXT,
+    SURVEY_BAD_FORMAT_TEXT,
+    SURVEY_TITLE_TOO_LONG_TEXT
+)
+from app.models import User
+from app.utils import CALLSIGN_TOO_LONG_MESSAGE
+
+
+def _message(text: str) -> Message:
+    """
+    Build an incoming command message with the given text.
+    """
+    return Message.model_validate({
+        'message_id': 5,
+        'date': 0,
+        'text': text,
+        'chat': {'id': -1001234567890, 'type': 'supergroup'},
+        'from': {'id': 1, 'is_bot': False, 'first_name': 'Test'}
+    })
+
+
+def _future_datetime() -> str:
+    """
+    Survey end date one day ahead in the command format.
+    """
+    return (datetime.now(settings.timezone_zoneinfo) + timedelta(days=1)).strftime('%Y-%m-%d %H:%M')
+
+
+class _Handlers:
+    """
+    Handler class with commands guarded by the validation decorators.
+    """
+
+    def __init__(self):
+        self.message_queue_service: Mock = Mock(enqueue_error=AsyncMock())
+
+    @CallsignDecorators.validate_callsign_create
+    async def reg_command(self, message: Message, *, callsign: str) -> str:
+        return callsign
+
+    @CallsignDecorators.validate_callsign_update
+    async def update_command(self, message: Message, *, callsign: str | None) -> tuple[str | None]:
+        return (callsign,)
+
+    @SurveyCreationDecorators.validate_survey_create
+    async def create_survey_command(self, message: Message, survey_name: str, end_datetime: datetime) -> tuple:
+        return survey_name, end_datetime
+
+    def error_text(self) -> str:
+        return self.message_queue_service.enqueue_error.await_args.kwargs['text']
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCallsignDecorators:
+    """
+    Unit tests for CallsignDecorators.
+    """
+
+    @pytest.mark.parametrize('text', ['/reg newuser', '/reg@test_bot newuser', '/reg\nnewuser'])
+    async def test_validate_callsign_create_passes_callsign(self, db: None, text: str):
+        """
+        Test that the parsed callsign is passed to the handler.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.reg_command(_message(text)) == 'newuser'
+        handlers.message_queue_service.enqueue_error.assert_not_awaited()
+
+    @pytest.mark.parametrize('text', ['/reg', '/reg new user'])
+    async def test_validate_callsign_create_requires_one_word(self, db: None, text: str):
+        """
+        Test that a missing callsign or extra words are rejected.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.reg_command(_message(text)) is None
+        assert handlers.error_text() == REG_NO_CALLSIGN_TEXT
+
+    @pytest.mark.parametrize('text', [f'/reg {"a" * 61}', f'/reg {"a b " * 20}'])
+    async def test_validate_callsign_create_length_guard(self, text: str):
+        """
+        Test that oversized commands get the callsign length error without database queries.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.reg_command(_message(text)) is None
+        assert CALLSIGN_TOO_LONG_MESSAGE in handlers.error_text()
+
+    async def test_validate_callsign_create_taken_callsign(self, db: None, test_user_regular: User):
+        """
+        Test that a callsign that is already taken is rejected.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.reg_command(_message(f'/reg {test_user_regular.callsign}')) is None
+        handlers.message_queue_service.enqueue_error.assert_awaited_once()
+
+    @pytest.mark.parametrize('text', ['/update', '/update@test_bot'])
+    async def test_validate_callsign_update_without_callsign(self, text: str):
+        """
+        Test that a bare command passes None as the callsign without database queries.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.update_command(_message(text)) == (None,)
+        handlers.message_queue_service.enqueue_error.assert_not_awaited()
+
+    @pytest.mark.parametrize('text', ['/update newuser', '/update@test_bot newuser extra'])
+    async def test_validate_callsign_update_with_callsign(self, db: None, text: str):
+        """
+        Test that the first word after the command is passed as the callsign.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.update_command(_message(text)) == ('newuser',)
+
+    async def test_validate_callsign_update_invalid_callsign(self, db: None):
+        """
+        Test that an invalid callsign is rejected.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.update_command(_message('/update user123')) is None
+        handlers.message_queue_service.enqueue_error.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSurveyCreationDecorators:
+    """
+    Unit tests for SurveyCreationDecorators.
+    """
+
+    @pytest.mark.parametrize('command', ['/create_survey ', '/create_survey@test_bot ', '/create_survey\n'])
+    async def test_validate_survey_create_passes_params(self, command: str):
+        """
+        Test that the survey name and end date are parsed after the command.
+        """
+        handlers: _Handlers = _Handlers()
+        end_datetime: str = _future_datetime()
+
+        survey_name, parsed_datetime = await handlers.create_survey_command(
+            _message(f'{command}Test survey + {end_datetime}')
+        )
+
+        assert survey_name == 'Test survey'
+        assert parsed_datetime.strftime('%Y-%m-%d %H:%M') == end_datetime
+        handlers.message_queue_service.enqueue_error.assert_not_awaited()
+
+    async def test_validate_survey_create_splits_on_last_separator(self):
+        """
+        Test that the survey name may contain the separator itself.
+        """
+        handlers: _Handlers = _Handlers()
+
+        survey_name, _ = await handlers.create_survey_command(
+            _message(f'/create_survey a + b + {_future_datetime()}')
+        )
+
+        assert survey_name == 'a + b'
+
+    @pytest.mark.parametrize('text, error_text', [
+        ('/create_survey', SURVEY_NO_PARAMS_TEXT),
+        ('/create_survey Test survey', SURVEY_BAD_FORMAT_TEXT),
+        ('/create_survey  + 2030-01-01 12:00', SURVEY_BAD_FORMAT_TEXT),
+        ('/create_survey\n+ 2030-01-01 12:00', SURVEY_BAD_FORMAT_TEXT)
+    ])
+    async def test_validate_survey_create_bad_format(self, text: str, error_text: str):
+        """
+        Test that malformed commands are rejected with the matching error.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.create_survey_command(_message(text)) is None
+        assert handlers.error_text() == error_text
+
+    async def test_validate_survey_create_checks_datetime_before_title_length(self):
+        """
+        Test that an invalid date is reported before a too long survey name.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.create_survey_command(_message(f'/create_survey {"a" * 101} + tomorrow')) is None
+        assert handlers.error_text().startswith('❌ Неверный формат даты и времени.')
+
+    async def test_validate_survey_create_title_too_long(self):
+        """
+        Test that a survey name over the length limit is rejected.
+        """
+        handlers: _Handlers = _Handlers()
+
+        assert await handlers.create_survey_command(
+            _message(f'/create_survey {"a" * 101} + {_future_datetime()}')
+        ) is None
+        assert handlers.error_text() == SURVEY_TITLE_TOO_LONG_TEXT